@@ -5,13 +5,21 @@ This module provides functionality to check OMF (Open Media Framework) and AAF (
 files for missing or unlinked audio media. It validates both embedded media and external file references.
 """
 
+import datetime
+import io
 import os
 import re
 import struct
 import json
+import mmap
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Tuple, Set
+from dataclasses import dataclass, fields
 
 try:
     import aaf2
@@ -19,15 +27,43 @@ try:
 except ImportError:
     AAF_SUPPORT = False
 
+# Per-clip dataclasses use __slots__ where supported (dataclass(slots=True) needs Python 3.10+;
+# the app may fall back to the system Python 3.9)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Global flag for debug verbosity (set in main)
 DEBUG_VERBOSE = True
 
 # Global debug file handle (set in main)
 _DEBUG_FILE = None
 
+# Final-verification results keyed by id() of the checked MOB (the MOB is stored alongside so the id stays valid)
+_verify_cache = {}
+
+# str(mob_id) per MOB, keyed the same way as _verify_cache
+_mob_id_cache = {}
+
+# Resolved locator path (or None) per descriptor, keyed the same way as _verify_cache
+_external_path_cache = {}
+
+# Direct descriptor-check results for MOBs with no validation match, keyed the same way as _verify_cache
+_slow_check_cache = {}
+
+# Structural attributes the timeline walker probes for, as bits of a per-class capability mask
+_CAP_MOB = 1
+_CAP_SEGMENT = 2
+_CAP_SEGMENTS = 4
+_CAP_COMPONENTS = 8
+_CAP_SLOTS = 16
+_CAP_NAMES = (('mob', _CAP_MOB), ('segment', _CAP_SEGMENT), ('segments', _CAP_SEGMENTS),
+              ('components', _CAP_COMPONENTS), ('slots', _CAP_SLOTS))
+_caps_cache: Dict[type, int] = {}
+
+# Locator URL schemes that point at media outside the file
+_EXTERNAL_URL_PREFIXES = ('file://', 'http://', 'https://')
+
 def _debug_print(message: str, verbose_only: bool = False):
     """Helper function to print debug messages, respecting DEBUG_VERBOSE flag."""
-    import sys
     if not verbose_only or DEBUG_VERBOSE:
         print(message, file=sys.stderr)
     
@@ -40,7 +76,111 @@ def _debug_print(message: str, verbose_only: bool = False):
             pass
 
 
-@dataclass
+def _attr(obj, name: str, default=None):
+    """
+    getattr() with a default that also covers aaf2 properties.
+    
+    aaf2 raises KeyError rather than AttributeError when the underlying property
+    is missing, so both are treated as "not present" and the default is returned.
+    """
+    try:
+        return getattr(obj, name)
+    except (AttributeError, KeyError):
+        return default
+
+
+def _clear_mob_caches():
+    """
+    Empties the per-object caches before a file is (re)opened.
+    
+    Objects from a previous aaf2.open() can never match again, so their entries would only
+    keep that file's object graph alive.
+    """
+    _verify_cache.clear()
+    _mob_id_cache.clear()
+    _external_path_cache.clear()
+    _slow_check_cache.clear()
+
+
+def _mob_id_str(mob) -> str:
+    """Returns the interned str() of a MOB's mob_id (or of id(mob) if it has none), cached per MOB."""
+    key = id(mob)
+    cached = _mob_id_cache.get(key)
+    if cached is not None and cached[0] is mob:
+        return cached[1]
+    mob_id = sys.intern(str(_attr(mob, 'mob_id', key)))
+    _mob_id_cache[key] = (mob, mob_id)
+    return mob_id
+
+
+def _caps(obj) -> int:
+    """
+    Returns the _CAP_* mask of structural attributes defined by obj's class, computed once per class.
+    
+    Only for attributes aaf2 defines as class properties (mob, segment(s), components, slots);
+    optional per-instance properties such as descriptor or locator still need _attr().
+    """
+    t = type(obj)
+    caps = _caps_cache.get(t)
+    if caps is None:
+        caps = 0
+        for name, bit in _CAP_NAMES:
+            if hasattr(t, name):
+                caps |= bit
+        _caps_cache[t] = caps
+    return caps
+
+
+def _iterable(value):
+    """Returns value if it can be iterated (e.g. an aaf2 slots/components vector), otherwise an empty tuple."""
+    return value if hasattr(value, '__iter__') else ()
+
+
+def _float_attr(obj, name: str, default: float = 0.0) -> float:
+    """Reads a numeric attribute (start, length, edit_rate, ...) as a float, see _attr()."""
+    value = _attr(obj, name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _descriptor_external_path(descriptor) -> Optional[str]:
+    """
+    Returns the external file path referenced by a descriptor's locator, or None.
+    
+    file:// URLs are reduced to their path; http(s) URLs are not treated as file references.
+    Results are cached per descriptor, since the same master clip is referenced from many places.
+    """
+    cached = _external_path_cache.get(id(descriptor))
+    if cached is not None and cached[0] is descriptor:
+        return cached[1]
+    path = _resolve_locator_path(getattr(descriptor, 'locator', None))
+    _external_path_cache[id(descriptor)] = (descriptor, path)
+    return path
+
+
+def _resolve_locator_path(locator) -> Optional[str]:
+    """Uncached body of _descriptor_external_path()."""
+    if not locator:
+        return None
+    path = getattr(locator, 'path', None)
+    if path:
+        return str(path)
+    url = getattr(locator, 'url_string', None)
+    if url is None:
+        return None
+    url = str(url)
+    if url.startswith('file://'):
+        return url[7:]  # Remove 'file://' prefix
+    if not url.startswith('http'):
+        return url
+    return None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MediaClip:
     """Represents an audio clip found in an OMF/AAF file."""
     name: str
@@ -81,23 +221,38 @@ class ValidationReport:
 # TODO: Revisit when we have a solution for extracting embedded essence data
 # Date archived: 2024-12-19
 # ============================================================================
-# @dataclass
-# class PlaybackClip:
-#     """Represents an audio clip for playback verification."""
-#     name: str
-#     file_path: str
-#     start_time: float = 0.0  # Offset within source file (in seconds)
-#     duration: float = 0.0      # Clip duration (in seconds, 0.0 means play entire file)
-#     track_index: int = 0      # Which track this clip is on (0-based)
-#     timeline_start: float = 0.0  # Start position in timeline (in seconds)
-#     timeline_end: float = 0.0    # End position in timeline (in seconds)
-#     source_in: float = 0.0      # In point within source file (in seconds)
-#     source_out: float = 0.0      # Out point within source file (in seconds)
+@dataclass(**_DATACLASS_SLOTS)
+class PlaybackClip:
+    """Represents an audio clip for playback verification."""
+    name: str
+    file_path: str
+    start_time: float = 0.0  # Offset within source file (in seconds)
+    duration: float = 0.0      # Clip duration (in seconds, 0.0 means play entire file)
+    track_index: int = 0      # Which track this clip is on (0-based)
+    timeline_start: float = 0.0  # Start position in timeline (in seconds)
+    timeline_end: float = 0.0    # End position in timeline (in seconds)
+    source_in: float = 0.0      # In point within source file (in seconds)
+    source_out: float = 0.0      # Out point within source file (in seconds)
+
+
+# Field names of the per-clip dataclasses, in declaration order (the order asdict() uses)
+_MEDIA_CLIP_FIELDS = tuple(f.name for f in fields(MediaClip))
+_PLAYBACK_CLIP_FIELDS = tuple(f.name for f in fields(PlaybackClip))
+
+
+def _clip_to_dict(clip, field_names: Tuple[str, ...]) -> Dict:
+    """
+    asdict() for the flat per-clip dataclasses. Every field is a scalar, so the recursive
+    walk and deepcopy asdict() does per value are skipped.
+    """
+    return {name: getattr(clip, name) for name in field_names}
 
 
+@lru_cache(maxsize=256)
 def _detect_file_type(file_path: str) -> str:
     """
     Detects whether a file is OMF or AAF based on extension and file header.
+    Cached per path, so validating and then extracting the same file reads its header once.
     
     Args:
         file_path: Path to the file
@@ -150,6 +305,7 @@ def _parse_aaf_file(file_path: str) -> List[MediaClip]:
     
     clips: List[MediaClip] = []
     processed_sources: Set[str] = set()  # Track processed sources to avoid duplicates
+    _clear_mob_caches()
     
     try:
         with aaf2.open(file_path, 'r') as f:
@@ -202,7 +358,7 @@ def _parse_aaf_file(file_path: str) -> List[MediaClip]:
                                         
                                         # Check slots for media
                                         if hasattr(mob, 'slots'):
-                                            slot_list = list(mob.slots) if hasattr(mob.slots, '__iter__') else []
+                                            slot_list = _iterable(mob.slots)
                                             for slot_idx, slot in enumerate(slot_list):
                                                 if hasattr(slot, 'segment'):
                                                     seg = slot.segment
@@ -211,22 +367,13 @@ def _parse_aaf_file(file_path: str) -> List[MediaClip]:
                                                         # Try to extract path
                                                         try:
                                                             if hasattr(seg.mob, 'descriptor'):
-                                                                desc = seg.mob.descriptor
-                                                                if hasattr(desc, 'locator') and desc.locator:
-                                                                    if hasattr(desc.locator, 'path'):
-                                                                        ext_path = str(desc.locator.path)
-                                                                    elif hasattr(desc.locator, 'url_string'):
-                                                                        url = str(desc.locator.url_string)
-                                                                        if url.startswith('file://'):
-                                                                            ext_path = url[7:]
-                                                                        elif not url.startswith('http'):
-                                                                            ext_path = url
+                                                                ext_path = _descriptor_external_path(seg.mob.descriptor)
                                                         except Exception:
                                                             pass
                                                         break
                                         
                                         if has_media:
-                                            mob_id = str(getattr(mob, 'mob_id', id(mob)))
+                                            mob_id = _mob_id_str(mob)
                                             if mob_id not in processed_sources:
                                                 processed_sources.add(mob_id)
                                                 name = getattr(mob, 'name', None) or f"Clip_{len(clips) + 1}"
@@ -287,7 +434,7 @@ def _extract_clips_from_segment(segment, clips: List[MediaClip], processed_sourc
             source_mob = segment.mob
             
             # Get source ID to avoid processing duplicates
-            source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
+            source_id = _mob_id_str(source_mob)
             if source_id in processed_sources:
                 return
             processed_sources.add(source_id)
@@ -350,19 +497,7 @@ def _extract_clips_from_segment(segment, clips: List[MediaClip], processed_sourc
                     descriptor = source_mob.descriptor
                     
                     # Check for external file reference
-                    if hasattr(descriptor, 'locator'):
-                        locator = descriptor.locator
-                        if locator:
-                            # Try to get file path from locator
-                            if hasattr(locator, 'path'):
-                                external_path = str(locator.path)
-                            elif hasattr(locator, 'url_string'):
-                                url = str(locator.url_string)
-                                # Extract file path from URL if it's a file:// URL
-                                if url.startswith('file://'):
-                                    external_path = url[7:]  # Remove 'file://' prefix
-                                elif not url.startswith('http'):
-                                    external_path = url
+                    external_path = _descriptor_external_path(descriptor)
                     
                     # Check if media is embedded (has essence data in the AAF)
                     if hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
@@ -382,20 +517,9 @@ def _extract_clips_from_segment(segment, clips: List[MediaClip], processed_sourc
                             if hasattr(seg, 'mob') and seg.mob:
                                 mob = seg.mob
                                 if hasattr(mob, 'descriptor'):
-                                    desc = mob.descriptor
-                                    if hasattr(desc, 'locator'):
-                                        loc = desc.locator
-                                        if loc and hasattr(loc, 'path'):
-                                            external_path = str(loc.path)
-                                            break
-                                        elif loc and hasattr(loc, 'url_string'):
-                                            url = str(loc.url_string)
-                                            if url.startswith('file://'):
-                                                external_path = url[7:]
-                                                break
-                                            elif not url.startswith('http'):
-                                                external_path = url
-                                                break
+                                    external_path = _descriptor_external_path(mob.descriptor)
+                                    if external_path:
+                                        break
                 
             except Exception as e:
                 # If we can't determine, assume it's linked and try to find path
@@ -426,14 +550,14 @@ def _extract_clips_from_segment(segment, clips: List[MediaClip], processed_sourc
         
         # Recursively process slots/segments
         if hasattr(segment, 'slots'):
-            slot_list = list(segment.slots) if hasattr(segment.slots, '__iter__') else []
+            slot_list = _iterable(segment.slots)
             for slot_idx, slot in enumerate(slot_list):
                 if hasattr(slot, 'segment') and slot.segment:
                     _extract_clips_from_segment(slot.segment, clips, processed_sources, aaf_file_path, depth + 1)
         
         # Also check for sequences
         if hasattr(segment, 'components'):
-            comp_list = list(segment.components) if hasattr(segment.components, '__iter__') else []
+            comp_list = _iterable(segment.components)
             for comp_idx, component in enumerate(comp_list):
                 _extract_clips_from_segment(component, clips, processed_sources, aaf_file_path, depth + 1)
     
@@ -570,8 +694,8 @@ def _parse_omf_file(file_path: str) -> List[MediaClip]:
     
     except Exception as e:
         _debug_print(f"DEBUG: Error parsing OMF file: {str(e)}", verbose_only=True)
-        import traceback
-        _debug_print(f"DEBUG: Traceback: {traceback.format_exc()}", verbose_only=True)
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Traceback: {traceback.format_exc()}")
         raise ValueError(f"Error parsing OMF file: {str(e)}")
     
     _debug_print(f"DEBUG: OMF parsing complete. Total clips: {len(clips)}", verbose_only=True)
@@ -997,6 +1121,15 @@ def validate_omf_aaf_media(file_path: str) -> ValidationReport:
     return report
 
 
+def _build_validation_clip_map(validation_clips: List[MediaClip]) -> Dict[str, MediaClip]:
+    """
+    Maps validation clips by clip_id for the timeline builders.
+    
+    Keys are stripped here, once, so lookups never need a .strip() fallback.
+    """
+    return {clip.clip_id.strip(): clip for clip in validation_clips if clip.clip_id}
+
+
 def _extract_timeline_clips_from_aaf(file_path: str, validation_clips: List[MediaClip]) -> Tuple[List[MediaClip], float]:
     """
     Extracts timeline information from an AAF file.
@@ -1016,10 +1149,8 @@ def _extract_timeline_clips_from_aaf(file_path: str, validation_clips: List[Medi
     total_duration = 0.0
     
     # Create a map of validation clips by clip_id for name matching
-    validation_clip_map: Dict[str, MediaClip] = {}
-    for clip in validation_clips:
-        if clip.clip_id:
-            validation_clip_map[clip.clip_id] = clip
+    validation_clip_map = _build_validation_clip_map(validation_clips)
+    _clear_mob_caches()
     
     try:
         with aaf2.open(file_path, 'r') as f:
@@ -1029,16 +1160,11 @@ def _extract_timeline_clips_from_aaf(file_path: str, validation_clips: List[Medi
             for comp_idx, composition in enumerate(compositions):
                 try:
                     # Get edit rate for time conversion
-                    edit_rate = 48000.0  # Default to 48kHz
-                    try:
-                        if hasattr(composition, 'edit_rate'):
-                            edit_rate = float(composition.edit_rate)
-                    except Exception:
-                        pass
+                    edit_rate = _float_attr(composition, 'edit_rate', 48000.0)  # Default to 48kHz
                     
                     # Get timeline slots (tracks)
                     if hasattr(composition, 'slots'):
-                        slots = list(composition.slots) if hasattr(composition.slots, '__iter__') else []
+                        slots = _iterable(composition.slots)
                         track_index = 0
                         
                         for slot_idx, slot in enumerate(slots):
@@ -1046,12 +1172,7 @@ def _extract_timeline_clips_from_aaf(file_path: str, validation_clips: List[Medi
                                 segment = slot.segment
                                 
                                 # Get slot position on timeline
-                                slot_position = 0.0
-                                try:
-                                    if hasattr(slot, 'start'):
-                                        slot_position = float(getattr(slot, 'start', 0))
-                                except Exception:
-                                    pass
+                                slot_position = _float_attr(slot, 'start')
                                 
                                 timeline_position = slot_position / edit_rate
                                 
@@ -1065,13 +1186,9 @@ def _extract_timeline_clips_from_aaf(file_path: str, validation_clips: List[Medi
                                 track_index += 1
                                 
                                 # Update total duration
-                                try:
-                                    if hasattr(slot, 'length'):
-                                        slot_length = float(getattr(slot, 'length', 0))
-                                        slot_end = (slot_position + slot_length) / edit_rate
-                                        total_duration = max(total_duration, slot_end)
-                                except Exception:
-                                    pass
+                                slot_length = _float_attr(slot, 'length')
+                                slot_end = (slot_position + slot_length) / edit_rate
+                                total_duration = max(total_duration, slot_end)
                 except Exception as e:
                     _debug_print(f"DEBUG: Error extracting timeline from composition {comp_idx}: {e}", verbose_only=True)
                     continue
@@ -1098,7 +1215,7 @@ def _extract_timeline_clips_from_segment(
         # Check if this is a SourceClip with a MOB
         if hasattr(segment, 'mob') and segment.mob is not None:
             source_mob = segment.mob
-            source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
+            source_id = _mob_id_str(source_mob)
             
             # Allow same clip to appear multiple times on timeline
             # (don't check processed_sources for timeline extraction)
@@ -1140,23 +1257,11 @@ def _extract_timeline_clips_from_segment(
                 
                 # Fallback: Try to get file name from locator
                 if not clip_name and hasattr(source_mob, 'descriptor'):
-                    desc = source_mob.descriptor
-                    if hasattr(desc, 'locator') and desc.locator:
-                        locator = desc.locator
-                        file_path = None
-                        if hasattr(locator, 'path'):
-                            file_path = str(locator.path)
-                        elif hasattr(locator, 'url_string'):
-                            url = str(locator.url_string)
-                            if url.startswith('file://'):
-                                file_path = url[7:]
-                            elif not url.startswith('http'):
-                                file_path = url
-                        
-                        if file_path:
-                            filename = os.path.basename(file_path)
-                            if filename and filename.lower() not in ['sourceclip', 'unnamed', '']:
-                                clip_name = os.path.splitext(filename)[0]  # Remove extension
+                    file_path = _descriptor_external_path(source_mob.descriptor)
+                    if file_path:
+                        filename = os.path.basename(file_path)
+                        if filename and filename.lower() not in ['sourceclip', 'unnamed', '']:
+                            clip_name = os.path.splitext(filename)[0]  # Remove extension
                 
                 # Final fallback: Use filename from matched clip if available
                 if not clip_name and matched_clip and matched_clip.external_path:
@@ -1173,15 +1278,8 @@ def _extract_timeline_clips_from_segment(
                 clip_name = f"Clip_{len(timeline_clips) + 1}"
             
             # Get segment timing
-            segment_start = 0.0
-            segment_length = 0.0
-            try:
-                if hasattr(segment, 'start'):
-                    segment_start = float(getattr(segment, 'start', 0))
-                if hasattr(segment, 'length'):
-                    segment_length = float(getattr(segment, 'length', 0))
-            except Exception:
-                pass
+            segment_start = _float_attr(segment, 'start')
+            segment_length = _float_attr(segment, 'length')
             
             # Calculate timeline positions
             # The clip's position is: slot position + clip's position within sequence
@@ -1228,15 +1326,10 @@ def _extract_timeline_clips_from_segment(
         
         # Recursively process nested segments (Sequences contain components)
         if hasattr(segment, 'components'):
-            comp_list = list(segment.components) if hasattr(segment.components, '__iter__') else []
+            comp_list = _iterable(segment.components)
             for comp in comp_list:
                 # Get component's position within the sequence
-                comp_start = 0.0
-                try:
-                    if hasattr(comp, 'start'):
-                        comp_start = float(getattr(comp, 'start', 0))
-                except Exception:
-                    pass
+                comp_start = _float_attr(comp, 'start')
                 
                 # Position within sequence: base position + component's start offset
                 # When the component (SourceClip) is processed, it will add its own start (which should be 0
@@ -1251,7 +1344,7 @@ def _extract_timeline_clips_from_segment(
         
         # Also check segments (for OperationGroups)
         if hasattr(segment, 'segments'):
-            seg_list = list(segment.segments) if hasattr(segment.segments, '__iter__') else []
+            seg_list = _iterable(segment.segments)
             for seg in seg_list:
                 _extract_timeline_clips_from_segment(
                     seg, timeline_clips, processed_sources,
@@ -1282,12 +1375,6 @@ def _extract_timeline_clips_from_omf(file_path: str, validation_clips: List[Medi
     timeline_clips: List[MediaClip] = []
     total_duration = 0.0
     
-    # Create a map of validation clips by clip_id for matching
-    validation_clip_map: Dict[str, MediaClip] = {}
-    for clip in validation_clips:
-        if clip.clip_id:
-            validation_clip_map[clip.clip_id] = clip
-    
     try:
         # OMF files have a binary chunk structure which is complex to parse fully
         # For now, we'll create a simplified timeline based on the validation clips
@@ -1364,342 +1451,6 @@ def _extract_timeline_clips_from_omf(file_path: str, validation_clips: List[Medi
     return timeline_clips, total_duration
 
 
-# ============================================================================
-# ARCHIVED: Playback verification feature - disabled due to aaf2 library limitations
-# TODO: Revisit when we have a solution for extracting embedded essence data
-# Date archived: 2024-12-19
-# ============================================================================
-# def _extract_playback_clips_from_aaf(file_path: str) -> List[PlaybackClip]:
-#     """
-#     Extracts playback-ready clips from an AAF file with timeline information.
-#     Efficient version: Skips validation parser, extracts timeline directly.
-#     
-#     Args:
-#         file_path: Path to the AAF file
-#         
-#     Returns:
-#         List[PlaybackClip]: List of clips ready for playback with timeline data
-#     """
-#     import sys
-#     if not AAF_SUPPORT:
-#         print("DEBUG: AAF support not available", file=sys.stderr, flush=True)
-#         return []
-#     
-#     playback_clips: List[PlaybackClip] = []
-#     processed_sources: Set[str] = set()
-#     
-#     try:
-#         msg = f"DEBUG: ===== STARTING PLAYBACK CLIP EXTRACTION FOR {file_path} ====="
-#         print(msg, file=sys.stderr, flush=True)
-#         if _DEBUG_FILE:
-#             _DEBUG_FILE.write(msg + "\n")
-#             _DEBUG_FILE.flush()
-#         
-#         # Check if file exists and is accessible
-#         if not os.path.exists(file_path):
-#             msg = f"DEBUG: ERROR: File does not exist: {file_path}"
-#             print(msg, file=sys.stderr, flush=True)
-#             if _DEBUG_FILE:
-#                 _DEBUG_FILE.write(msg + "\n")
-#                 _DEBUG_FILE.flush()
-#             return []
-#         
-#         if not os.path.isfile(file_path):
-#             msg = f"DEBUG: ERROR: Path is not a file: {file_path}"
-#             print(msg, file=sys.stderr, flush=True)
-#             if _DEBUG_FILE:
-#                 _DEBUG_FILE.write(msg + "\n")
-#                 _DEBUG_FILE.flush()
-#             return []
-#         
-#         # Check file size (if 0, might be a placeholder)
-#         try:
-#             file_size = os.path.getsize(file_path)
-#             msg = f"DEBUG: File size: {file_size} bytes"
-#             print(msg, file=sys.stderr, flush=True)
-#             if _DEBUG_FILE:
-#                 _DEBUG_FILE.write(msg + "\n")
-#                 _DEBUG_FILE.flush()
-#             if file_size == 0:
-#                 msg = "DEBUG: WARNING: File size is 0 bytes - file may not be fully synced (if in cloud storage)"
-#                 print(msg, file=sys.stderr, flush=True)
-#                 if _DEBUG_FILE:
-#                     _DEBUG_FILE.write(msg + "\n")
-#                     _DEBUG_FILE.flush()
-#         except Exception as e:
-#             msg = f"DEBUG: Could not check file size: {e}"
-#             print(msg, file=sys.stderr, flush=True)
-#             if _DEBUG_FILE:
-#                 _DEBUG_FILE.write(msg + "\n")
-#                 _DEBUG_FILE.flush()
-#         
-#         _debug_print("DEBUG: Extracting timeline clips from AAF file", verbose_only=True)
-#         
-#         try:
-#             with aaf2.open(file_path, 'r') as f:
-#                 # Get all compositions (timelines) - skip validation parser
-#                 compositions = []
-#                 try:
-#                     if hasattr(f.content, 'compositions'):
-#                         compositions = list(f.content.compositions) if hasattr(f.content.compositions, '__iter__') else []
-#                     elif hasattr(f.content, 'toplevel'):
-#                         toplevel = list(f.content.toplevel()) if hasattr(f.content.toplevel, '__call__') else []
-#                         compositions = [item for item in toplevel if hasattr(item, 'slots')]
-#                 except Exception as e:
-#                     _debug_print(f"DEBUG: Error getting compositions: {str(e)}", verbose_only=True)
-#                     return []
-#                 
-#                 if not compositions:
-#                     _debug_print("DEBUG: No compositions found", verbose_only=True)
-#                     return []
-#                 
-#                 _debug_print(f"DEBUG: Found {len(compositions)} composition(s)", verbose_only=True)
-#                 
-#                 # Process each composition to extract timeline clips
-#                 for comp_idx, composition in enumerate(compositions):
-#                     try:
-#                         _extract_timeline_from_composition_simple(composition, playback_clips, processed_sources, file_path, comp_idx)
-#                     except Exception as e:
-#                         _debug_print(f"DEBUG: Error processing composition {comp_idx}: {e}", verbose_only=True)
-#                         continue
-#         except TimeoutError as e:
-#             import sys
-#             msg = f"DEBUG: ERROR: Timeout opening AAF file. This may happen if the file is in cloud storage and not fully synced locally. File: {file_path}"
-#             print(msg, file=sys.stderr, flush=True)
-#             if _DEBUG_FILE:
-#                 _DEBUG_FILE.write(msg + "\n")
-#                 _DEBUG_FILE.write(f"DEBUG: TimeoutError details: {str(e)}\n")
-#                 _DEBUG_FILE.flush()
-#             _debug_print(f"DEBUG: TimeoutError: {str(e)}", verbose_only=True)
-#             return []
-#         except OSError as e:
-#             import sys
-#             if e.errno == 60:  # Operation timed out
-#                 msg = f"DEBUG: ERROR: Operation timed out opening AAF file. This may happen if the file is in cloud storage (e.g., Google Drive) and not fully synced locally. File: {file_path}"
-#                 print(msg, file=sys.stderr, flush=True)
-#                 if _DEBUG_FILE:
-#                     _DEBUG_FILE.write(msg + "\n")
-#                     _DEBUG_FILE.write(f"DEBUG: OSError details: {str(e)}\n")
-#                     _DEBUG_FILE.flush()
-#                 _debug_print(f"DEBUG: OSError (timeout): {str(e)}", verbose_only=True)
-#                 return []
-#             else:
-#                 raise  # Re-raise if it's a different OSError
-#         
-#         import sys
-#         msg = f"DEBUG: ===== FINISHED PLAYBACK CLIP EXTRACTION: Found {len(playback_clips)} clips ====="
-#         print(msg, file=sys.stderr, flush=True)
-#         if _DEBUG_FILE:
-#             _DEBUG_FILE.write(msg + "\n")
-#             _DEBUG_FILE.flush()
-#         _debug_print(f"DEBUG: Returning {len(playback_clips)} playback clips", verbose_only=True)
-#     
-#     except Exception as e:
-#         import sys
-#         msg = f"DEBUG: ===== ERROR IN PLAYBACK CLIP EXTRACTION: {str(e)} ====="
-#         print(msg, file=sys.stderr, flush=True)
-#         if _DEBUG_FILE:
-#             _DEBUG_FILE.write(msg + "\n")
-#             _DEBUG_FILE.flush()
-#         _debug_print(f"DEBUG: Error extracting clips: {str(e)}", verbose_only=True)
-#         import traceback
-#         print(f"DEBUG: Traceback: {traceback.format_exc()}", file=sys.stderr, flush=True)
-#         _debug_print(f"DEBUG: Traceback: {traceback.format_exc()}", verbose_only=True)
-#     
-#     return playback_clips
-
-
-# ARCHIVED: Helper function for playback extraction
-# def _extract_timeline_from_composition_simple(composition, playback_clips: List[PlaybackClip], processed_sources: Set[str], aaf_file_path: str, comp_index: int):
-#     """
-#     Simplified timeline extraction - no validation parser, no complex matching.
-#     Just extracts clips from timeline and checks if they're embedded.
-#     """
-#     try:
-#         # Get edit rate for time conversion
-#         edit_rate = 48000.0  # Default
-#         try:
-#             if hasattr(composition, 'edit_rate'):
-#                 edit_rate = float(composition.edit_rate)
-#         except Exception:
-#             pass
-#         
-#         # Get timeline slots (tracks)
-#         if not hasattr(composition, 'slots'):
-#             return
-#         
-#         slots = list(composition.slots) if hasattr(composition.slots, '__iter__') else []
-#         track_index = 0
-#         timeline_position = 0.0
-#         
-#         for slot_idx, slot in enumerate(slots):
-#             if not hasattr(slot, 'segment') or not slot.segment:
-#                 continue
-#             
-#             segment = slot.segment
-#             slot_start = 0.0
-#             try:
-#                 if hasattr(slot, 'start'):
-#                     slot_start = float(getattr(slot, 'start', 0))
-#             except Exception:
-#                 pass
-#             
-#             timeline_position = slot_start / edit_rate
-#             
-#             # Extract clips from this track segment (simplified recursion)
-#             _extract_clips_from_segment_simple(segment, playback_clips, processed_sources, 
-#                                               aaf_file_path, track_index, timeline_position, edit_rate, depth=0)
-#             track_index += 1
-#     
-#     except Exception as e:
-#         _debug_print(f"DEBUG: Error in timeline extraction: {e}", verbose_only=True)
-
-
-# ARCHIVED: Helper function for playback extraction
-# def _extract_clips_from_segment_simple(segment, playback_clips, processed_sources, aaf_file_path, track_index, timeline_position, edit_rate, depth=0):
-#     """ARCHIVED: Disabled due to aaf2 library limitations"""
-#     return
-#     # Original implementation commented out - see git history
-#     # MAX_DEPTH = 10  # Increased slightly but still limited
-#     # if depth > MAX_DEPTH:
-#     #     return
-#     
-#     try:
-        # Check if this segment is a SourceClip
-        # if hasattr(segment, 'mob') and segment.mob is not None:
-            # source_mob = segment.mob
-            # source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
-            
-            # if source_id in processed_sources:
-                # return
-            
-            # Follow MOB chain to find Essence MOB and check if embedded
-            # essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-            # check_mob = essence_mob if essence_mob else source_mob
-            
-            # Check if embedded
-            # is_embedded = False
-            # external_path = None
-            # try:
-                # if hasattr(check_mob, 'descriptor'):
-                    # descriptor = check_mob.descriptor
-                    # Check for external locator first
-                    # if hasattr(descriptor, 'locator') and descriptor.locator:
-                        # locator = descriptor.locator
-                        # if hasattr(locator, 'path'):
-                            # external_path = str(locator.path)
-                        # elif hasattr(locator, 'url_string'):
-                            # url = str(locator.url_string)
-                            # if url.startswith('file://'):
-                                # external_path = url[7:]
-                            # elif not url.startswith('http'):
-                                # external_path = url
-                    
-                    # If no external path, check for embedded essence
-                    # if not external_path:
-                        # if hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                            # is_embedded = True
-                
-                # if not is_embedded and not external_path:
-                    # if hasattr(check_mob, 'essence'):
-                        # is_embedded = True
-            # except Exception:
-                # pass
-            
-            # Only process embedded clips (no external path)
-            # if is_embedded and not external_path:
-                # FINAL VERIFICATION: Always double-check the MOB for external locators
-                # import sys
-                # msg = f"DEBUG: [_extract_clips_from_segment_simple] Running final verification for clip (source_id={source_id})"
-                # print(msg, file=sys.stderr, flush=True)
-                # if _DEBUG_FILE:
-                    # _DEBUG_FILE.write(msg + "\n")
-                    # _DEBUG_FILE.flush()
-                # is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                # if not is_embedded:
-                    # msg = f"DEBUG: [_extract_clips_from_segment_simple] REJECTED clip (source_id={source_id}): Final verification failed - MOB has external locator"
-                    # print(msg, file=sys.stderr, flush=True)
-                    # if _DEBUG_FILE:
-                        # _DEBUG_FILE.write(msg + "\n")
-                        # _DEBUG_FILE.flush()
-                
-                # if is_embedded:
-                    # clip_name = getattr(segment, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
-                    # if not clip_name:
-                        # clip_name = f"Clip_{len(playback_clips) + 1}"
-                    
-                    # segment_start = 0.0
-                    # segment_length = 0.0
-                    # try:
-                        # if hasattr(segment, 'start'):
-                            # segment_start = float(getattr(segment, 'start', 0))
-                        # if hasattr(segment, 'length'):
-                            # segment_length = float(getattr(segment, 'length', 0))
-                    # except Exception:
-                        # pass
-                    
-                    # clip_start = timeline_position
-                    # source_start = segment_start / edit_rate
-                    # clip_length = segment_length / edit_rate if segment_length > 0 else 0.0
-                    
-                    # Use essence MOB ID if found, otherwise use source MOB ID
-                    # essence_id = str(getattr(essence_mob, 'mob_id', id(essence_mob))) if essence_mob else source_id
-                    # embedded_path = f"EMBEDDED:{aaf_file_path}:{essence_id}"
-                    
-                    # msg = f"DEBUG: [_extract_clips_from_segment_simple] ADDING clip '{clip_name}' (source_id={source_id}, essence_id={essence_id})"
-                    # print(msg, file=sys.stderr, flush=True)
-                    # if _DEBUG_FILE:
-                        # _DEBUG_FILE.write(msg + "\n")
-                        # _DEBUG_FILE.flush()
-                    
-                    # playback_clip = PlaybackClip(
-                        # name=clip_name,
-                        # file_path=embedded_path,
-                        # start_time=source_start,
-                        # duration=clip_length,
-                        # track_index=track_index,
-                        # timeline_start=clip_start,
-                        # timeline_end=clip_start + clip_length,
-                        # source_in=source_start,
-                        # source_out=source_start + clip_length
-                    # )
-                    # playback_clips.append(playback_clip)
-                    # processed_sources.add(source_id)
-                    # if essence_mob:
-                        # processed_sources.add(essence_id)
-                    
-                    # if segment_length > 0:
-                        # timeline_position += segment_length / edit_rate
-        
-        # Handle OperationGroups - simplified recursion
-        # if hasattr(segment, 'segments'):
-            # segments = list(segment.segments) if hasattr(segment.segments, '__iter__') else []
-            # for seg in segments:
-                # _extract_clips_from_segment_simple(seg, playback_clips, processed_sources,
-                                                  # aaf_file_path, track_index, timeline_position, edit_rate, depth + 1)
-        
-        # Handle components - simplified recursion
-        # if hasattr(segment, 'components'):
-            # components = list(segment.components) if hasattr(segment.components, '__iter__') else []
-            # current_pos = timeline_position
-            # for component in components:
-                # comp_length = 0.0
-                # try:
-                    # if hasattr(component, 'length'):
-                        # comp_length = float(getattr(component, 'length', 0)) / edit_rate
-                # except Exception:
-                    # pass
-                
-                # _extract_clips_from_segment_simple(component, playback_clips, processed_sources,
-                                                  # aaf_file_path, track_index, current_pos, edit_rate, depth + 1)
-                
-                # if comp_length > 0:
-                    # current_pos += comp_length
-    
-    # except Exception as e:
-        # _debug_print(f"DEBUG: Error in segment extraction: {e}", verbose_only=True)
-
-
 # ARCHIVED: Helper function for playback extraction (but also used by validation, so keep it)
 # Note: This function is still used by validation, so we'll keep it active
 def _find_essence_mob_from_composition_mob(composition_mob):
@@ -1750,6 +1501,19 @@ def _find_essence_mob_from_composition_mob(composition_mob):
     return None
 
 
+def _find_essence_mob_cached(source_mob, source_id: str, essence_mob_cache: Dict):
+    """
+    Memoized _find_essence_mob_from_composition_mob, keyed by the source MOB id.
+    
+    Misses are cached as None too, since the same clip recurs across tracks and cuts.
+    """
+    if source_id in essence_mob_cache:
+        return essence_mob_cache[source_id]
+    essence_mob = _find_essence_mob_from_composition_mob(source_mob)
+    essence_mob_cache[source_id] = essence_mob
+    return essence_mob
+
+
 # ARCHIVED: Helper function for playback extraction (but also used by validation, so keep it)
 # Note: This function is still used by validation, so we'll keep it active
 def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
@@ -1764,7 +1528,6 @@ def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
     Returns:
         bool: True if embedded (no external locator), False otherwise
     """
-    import sys
     check_mob = essence_mob if essence_mob else source_mob
     if not check_mob:
         msg = "DEBUG: _verify_essence_mob_is_embedded: No MOB to check"
@@ -1774,7 +1537,7 @@ def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
             _DEBUG_FILE.flush()
         return False
     
-    mob_id = str(getattr(check_mob, 'mob_id', id(check_mob)))
+    mob_id = _mob_id_str(check_mob)
     msg = f"DEBUG: _verify_essence_mob_is_embedded: Checking MOB {mob_id}"
     print(msg, file=sys.stderr, flush=True)
     if _DEBUG_FILE:
@@ -1792,16 +1555,17 @@ def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
                     _DEBUG_FILE.flush()
                 return False
             
-            # DEBUG: Inspect descriptor structure
-            try:
-                desc_attrs = [attr for attr in dir(descriptor) if not attr.startswith('_')]
-                msg = f"DEBUG: _verify_essence_mob_is_embedded: MOB {mob_id} descriptor attributes: {', '.join(desc_attrs[:15])}"
-                print(msg, file=sys.stderr, flush=True)
-                if _DEBUG_FILE:
-                    _DEBUG_FILE.write(msg + "\n")
-                    _DEBUG_FILE.flush()
-            except Exception:
-                pass
+            # DEBUG: Inspect descriptor structure (dir() walks the whole MRO, only do it when verbose)
+            if DEBUG_VERBOSE:
+                try:
+                    desc_attrs = [attr for attr in dir(descriptor) if not attr.startswith('_')]
+                    msg = f"DEBUG: _verify_essence_mob_is_embedded: MOB {mob_id} descriptor attributes: {', '.join(desc_attrs[:15])}"
+                    print(msg, file=sys.stderr, flush=True)
+                    if _DEBUG_FILE:
+                        _DEBUG_FILE.write(msg + "\n")
+                        _DEBUG_FILE.flush()
+                except Exception:
+                    pass
             
             # CRITICAL: Check for external locator FIRST - if it exists, NOT embedded
             # First, check if locator attribute exists and has a value
@@ -1886,7 +1650,7 @@ def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
                             _DEBUG_FILE.write(msg + "\n")
                             _DEBUG_FILE.flush()
                         # Only embedded if it's not a file:// or http:// URL
-                        if locator_url.startswith('file://') or locator_url.startswith('http://') or locator_url.startswith('https://'):
+                        if locator_url.startswith(_EXTERNAL_URL_PREFIXES):
                             msg = f"DEBUG: _verify_essence_mob_is_embedded: MOB {mob_id} has external URL (file:// or http://)"
                             print(msg, file=sys.stderr, flush=True)
                             if _DEBUG_FILE:
@@ -1977,7 +1741,6 @@ def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
         if _DEBUG_FILE:
             _DEBUG_FILE.write(msg + "\n")
             _DEBUG_FILE.flush()
-        import traceback
         tb_msg = f"DEBUG: _verify_essence_mob_is_embedded: Traceback: {traceback.format_exc()}"
         print(tb_msg, file=sys.stderr, flush=True)
         if _DEBUG_FILE:
@@ -1986,6 +1749,28 @@ def _verify_essence_mob_is_embedded(essence_mob, source_mob) -> bool:
         return False
 
 
+def _verify_embedded_cached(essence_mob, source_mob) -> bool:
+    """
+    Final verification for a clip that was already resolved as embedded.
+    
+    A MOB can only turn out to be external through a descriptor locator, so the full
+    _verify_essence_mob_is_embedded walk is skipped when the descriptor has none.
+    Results are cached per MOB.
+    """
+    check_mob = essence_mob if essence_mob else source_mob
+    cached = _verify_cache.get(id(check_mob))
+    if cached is not None and cached[0] is check_mob:
+        return cached[1]
+    
+    descriptor = _attr(check_mob, 'descriptor')
+    if descriptor is not None and not _attr(descriptor, 'locator'):
+        result = True
+    else:
+        result = _verify_essence_mob_is_embedded(essence_mob, source_mob)
+    _verify_cache[id(check_mob)] = (check_mob, result)
+    return result
+
+
 # ARCHIVED: Helper function for playback extraction
 def _extract_timeline_from_composition(composition, playback_clips, processed_sources, aaf_file_path, comp_index, validation_clip_map=None, essence_mob_cache=None):
     """ARCHIVED: Disabled due to aaf2 library limitations"""
@@ -1998,129 +1783,345 @@ def _extract_timeline_from_composition(composition, playback_clips, processed_so
     # import sys
     
     try:
-        _debug_print(f"DEBUG: === Extracting timeline from composition {comp_index} ===", verbose_only=True)
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: === Extracting timeline from composition {comp_index} ===")
         
         # Get composition name
         comp_name = getattr(composition, 'name', 'Unnamed Composition')
-        _debug_print(f"DEBUG: Composition name: {comp_name}", verbose_only=True)
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Composition name: {comp_name}")
         
         # Try to get edit rate for time conversion
-        edit_rate = 48000.0  # Default to 48kHz
-        try:
-            if hasattr(composition, 'edit_rate'):
-                edit_rate = float(composition.edit_rate)
-                _debug_print(f"DEBUG: Composition edit_rate: {edit_rate}", verbose_only=True)
-        except Exception as e:
-            _debug_print(f"DEBUG: Could not get edit_rate: {e}", verbose_only=True)
+        edit_rate = _float_attr(composition, 'edit_rate', 48000.0)  # Default to 48kHz
+        inv_edit_rate = 1.0 / edit_rate  # multiply instead of dividing for each slot
+        # EMBEDDED:<file>: pseudo-path prefix, built once here and passed down the walk
+        embedded_prefix = f"EMBEDDED:{aaf_file_path}:"
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Composition edit_rate: {edit_rate}")
         
         # Get timeline slots (tracks)
         if hasattr(composition, 'slots'):
-            slots = list(composition.slots) if hasattr(composition.slots, '__iter__') else []
-            _debug_print(f"DEBUG: Composition has {len(slots)} slot(s)", verbose_only=True)
+            slots = _iterable(composition.slots)
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Composition has {len(slots)} slot(s)")
             
             track_index = 0
             for slot_idx, slot in enumerate(slots):
-                _debug_print(f"DEBUG: --- Processing slot {slot_idx} ---", verbose_only=True)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: --- Processing slot {slot_idx} ---")
                 
                 # Get slot properties
                 slot_name = getattr(slot, 'name', None)
                 slot_type = type(slot).__name__
-                _debug_print(f"DEBUG: Slot {slot_idx}: name={slot_name}, type={slot_type}", verbose_only=True)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Slot {slot_idx}: name={slot_name}, type={slot_type}")
                 
                 # Get slot position on timeline
-                slot_position = 0.0
-                try:
-                    if hasattr(slot, 'start'):
-                        slot_position = float(getattr(slot, 'start', 0))
-                        _debug_print(f"DEBUG: Slot {slot_idx} start position: {slot_position} edit units", verbose_only=True)
-                except Exception as e:
-                    _debug_print(f"DEBUG: Could not get slot start: {e}", verbose_only=True)
+                slot_position = _float_attr(slot, 'start')
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Slot {slot_idx} start position: {slot_position} edit units")
                 
                 # Get slot length
-                slot_length = 0.0
-                try:
-                    if hasattr(slot, 'length'):
-                        slot_length = float(getattr(slot, 'length', 0))
-                        _debug_print(f"DEBUG: Slot {slot_idx} length: {slot_length} edit units", verbose_only=True)
-                except Exception as e:
-                    _debug_print(f"DEBUG: Could not get slot length: {e}", verbose_only=True)
+                slot_length = _float_attr(slot, 'length')
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Slot {slot_idx} length: {slot_length} edit units")
                 
                 # Check for media kind (audio vs video)
                 try:
                     if hasattr(slot, 'media_kind'):
                         media_kind = getattr(slot, 'media_kind', None)
-                        _debug_print(f"DEBUG: Slot {slot_idx} media_kind: {media_kind}", verbose_only=True)
+                        if DEBUG_VERBOSE:
+                            _debug_print(f"DEBUG: Slot {slot_idx} media_kind: {media_kind}")
                 except Exception as e:
-                    _debug_print(f"DEBUG: Could not get media_kind: {e}", verbose_only=True)
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Could not get media_kind: {e}")
                 
-                # Get all slot attributes for debugging
-                try:
-                    slot_attrs = [attr for attr in dir(slot) if not attr.startswith('_')]
-                    _debug_print(f"DEBUG: Slot {slot_idx} available attributes: {', '.join(slot_attrs[:20])}", verbose_only=True)
-                except Exception:
-                    pass
+                # Get all slot attributes for debugging (dir() is expensive, only walk it when verbose)
+                if DEBUG_VERBOSE:
+                    try:
+                        slot_attrs = [attr for attr in dir(slot) if not attr.startswith('_')]
+                        _debug_print(f"DEBUG: Slot {slot_idx} available attributes: {', '.join(slot_attrs[:20])}")
+                    except Exception:
+                        pass
                 
                 if hasattr(slot, 'segment') and slot.segment:
                     segment = slot.segment
                     segment_type = type(segment).__name__
                     segment_name = getattr(segment, 'name', 'Unnamed Segment')
-                    _debug_print(f"DEBUG: Slot {slot_idx} segment: name={segment_name}, type={segment_type}", verbose_only=True)
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Slot {slot_idx} segment: name={segment_name}, type={segment_type}")
                     
                     # Convert slot position to seconds
-                    timeline_position = slot_position / edit_rate
-                    _debug_print(f"DEBUG: Slot {slot_idx} timeline position: {timeline_position:.3f} seconds", verbose_only=True)
+                    timeline_position = slot_position * inv_edit_rate
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Slot {slot_idx} timeline position: {timeline_position:.3f} seconds")
                     
                     _extract_clips_from_track(segment, playback_clips, processed_sources, 
-                                             aaf_file_path, track_index, timeline_position, edit_rate, depth=0, slot_idx=slot_idx, validation_clip_map=validation_clip_map, essence_mob_cache=essence_mob_cache)
+                                             aaf_file_path, track_index, timeline_position, edit_rate, depth=0, slot_idx=slot_idx, validation_clip_map=validation_clip_map, essence_mob_cache=essence_mob_cache,
+                                             embedded_prefix=embedded_prefix)
                     track_index += 1
                 else:
-                    _debug_print(f"DEBUG: Slot {slot_idx} has no segment", verbose_only=True)
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Slot {slot_idx} has no segment")
         else:
-            _debug_print(f"DEBUG: Composition has no 'slots' attribute", verbose_only=True)
-            # Try to find other ways to access tracks
-            comp_attrs = [attr for attr in dir(composition) if not attr.startswith('_')]
-            _debug_print(f"DEBUG: Composition available attributes: {', '.join(comp_attrs[:30])}", verbose_only=True)
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Composition has no 'slots' attribute")
+                # Try to find other ways to access tracks
+                comp_attrs = [attr for attr in dir(composition) if not attr.startswith('_')]
+                _debug_print(f"DEBUG: Composition available attributes: {', '.join(comp_attrs[:30])}")
     except Exception as e:
-        _debug_print(f"DEBUG: Error extracting timeline from composition: {e}", verbose_only=True)
-        import traceback
-        _debug_print(f"DEBUG: Traceback: {traceback.format_exc()}", verbose_only=True)
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error extracting timeline from composition: {e}")
+            _debug_print(f"DEBUG: Traceback: {traceback.format_exc()}")
+
+
+# Nesting limit for the recursive timeline walker (_extract_clips_from_track)
+_MAX_TRACK_DEPTH = 20
 
 
 # ARCHIVED: Helper function for playback extraction
-def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_file_path, track_index, timeline_position, edit_rate, depth=0, slot_idx=0, validation_clip_map=None, essence_mob_cache=None):
+def _lookup_clip(validation_clip_map, *candidate_ids):
+    """
+    Finds the validation clip for a timeline SourceClip, trying candidate ids in order
+    (essence MOB id first, then source MOB id). Empty candidates are skipped.
+    
+    validation_clip_map keys are stripped when the map is built, so a single probe per id is enough.
+    """
+    if not validation_clip_map:
+        return None
+    for key in candidate_ids:
+        if key and (clip := validation_clip_map.get(key)) is not None:
+            return clip
+    return None
+
+
+def _slow_embedded_check(check_mob, log_prefix: str) -> bool:
+    """
+    Cold path of _resolve_is_embedded for clips with no validation match: inspects the
+    MOB's descriptor directly (same logic as the validation parser), then applies the final
+    locator verification, so the cached result per MOB is the final answer.
+    """
+    cached = _slow_check_cache.get(id(check_mob))
+    if cached is not None and cached[0] is check_mob:
+        return cached[1]
+    
+    is_embedded = False
+    try:
+        if hasattr(check_mob, 'descriptor'):
+            descriptor = check_mob.descriptor
+            # CRITICAL: Check for locator FIRST (external file) - if it exists, NOT embedded
+            if _descriptor_external_path(descriptor):
+                is_embedded = False
+            # If no external path, check for essence (embedded)
+            elif hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
+                is_embedded = True
+        
+        if not is_embedded and hasattr(check_mob, 'essence'):
+            is_embedded = True
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Error checking embedded status: {e}")
+    if is_embedded:
+        is_embedded = _verify_embedded_cached(check_mob, check_mob)
+    _slow_check_cache[id(check_mob)] = (check_mob, is_embedded)
+    return is_embedded
+
+
+def _resolve_is_embedded(source_mob, source_id: str, validation_clip_map, essence_mob_cache, log_prefix: str):
+    """
+    Decides whether the media behind a timeline SourceClip is embedded.
+    
+    Follows the source MOB to its essence MOB, takes the validation parser's verdict for
+    the matched clip (overridden by an external locator), falls back to inspecting the
+    descriptor directly, and finally runs the locator verification if it hasn't already
+    effectively been done.
+    
+    Returns:
+        Tuple of (is_embedded, matched validation clip or None, essence MOB or None, essence_id or None)
+    """
+    # Follow the MOB reference chain to find the Essence MOB
+    # The source_mob is a Composition MOB, we need to find the Essence MOB it references
+    essence_mob = _find_essence_mob_cached(source_mob, source_id, essence_mob_cache)
+    essence_id = None
+    if essence_mob:
+        essence_id = _mob_id_str(essence_mob)
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Found Essence MOB: {essence_id}")
+    check_mob = essence_mob if essence_mob else source_mob
+    
+    is_embedded = False
+    locator_already_verified = False
+    # Essence MOB ID is the most reliable match, source_id (Composition MOB) the fallback
+    if (matched_validation_clip := _lookup_clip(validation_clip_map, essence_id, source_id)):
+        is_embedded = matched_validation_clip.is_embedded
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Matched validation clip: {matched_validation_clip.name}, embedded={is_embedded}")
+        # VERIFY: Double-check for external locator even if validation says embedded
+        descriptor = _attr(check_mob, 'descriptor')
+        if is_embedded and _attr(descriptor, 'locator'):
+            is_embedded = False
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Overriding: MOB has external locator, not embedded")
+        # This is the same check final verification would make, so it can be skipped below
+        locator_already_verified = descriptor is not None
+    else:
+        is_embedded = _slow_embedded_check(check_mob, log_prefix)
+        locator_already_verified = True  # _slow_embedded_check includes the final verification
+    
+    if DEBUG_VERBOSE:
+        _debug_print(f"{log_prefix} Is embedded: {is_embedded}")
+    
+    # FINAL VERIFICATION: Always double-check the essence MOB for external locators
+    # This is a safety net to catch any clips that slip through
+    if is_embedded and not locator_already_verified:
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Running final verification (source_id={source_id}, essence_id={essence_id})")
+        is_embedded = _verify_embedded_cached(essence_mob, source_mob)
+        if not is_embedded:
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} REJECTED (source_id={source_id}, essence_id={essence_id}): Final verification failed - MOB has external locator")
+    
+    return is_embedded, matched_validation_clip, essence_mob, essence_id
+
+
+def _process_op_segment(op_seg, seg_idx, track_index, slot_idx, timeline_position, edit_rate, aaf_file_path, playback_clips,
+                        processed_sources, validation_clip_map, essence_mob_cache, depth, log_prefix, embedded_prefix) -> float:
+    """
+    Processes one segment of an OperationGroup, adding it as a clip if it is an embedded SourceClip.
+    
+    Shared by the OperationGroup-as-segment and OperationGroup-as-component paths of
+    _extract_clips_from_track. Returns the updated timeline position (in seconds).
+    """
+    seg_type = type(op_seg).__name__
+    if DEBUG_VERBOSE:
+        _debug_print(f"{log_prefix} OperationGroup segment {seg_idx}: type={seg_type}")
+    
+    # If this segment is another OperationGroup, recursively search it
+    if seg_type == 'OperationGroup':
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Nested OperationGroup found, recursively searching...")
+        _extract_clips_from_track(op_seg, playback_clips, processed_sources,
+                                  aaf_file_path, track_index, timeline_position, edit_rate, depth + 1, slot_idx, validation_clip_map, essence_mob_cache,
+                                  embedded_prefix)
+        return timeline_position
+    
+    # Check if this segment is a SourceClip (has mob attribute)
+    if not (_caps(op_seg) & _CAP_MOB and op_seg.mob is not None):
+        return timeline_position
+    
+    source_mob = op_seg.mob
+    source_id = _mob_id_str(source_mob)
+    
+    if DEBUG_VERBOSE:
+        _debug_print(f"{log_prefix} Found SourceClip in OperationGroup segment {seg_idx}: {source_id}")
+    
+    # Note: We allow the same clip to appear multiple times on the timeline
+    # Check if embedded - use validation parser's determination, then verify locators
+    # (classification is memoized per MOB, so it comes first and non-embedded clips skip the rest)
+    is_embedded, matched_validation_clip, essence_mob, essence_id = _resolve_is_embedded(
+        source_mob, source_id, validation_clip_map, essence_mob_cache, log_prefix)
+    
+    # Only process embedded clips
+    if is_embedded:
+        # Use validation clip name if available
+        if matched_validation_clip:
+            clip_name = matched_validation_clip.name
+        else:
+            clip_name = getattr(op_seg, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
+            if not clip_name:
+                clip_name = f"Clip_{len(playback_clips) + 1}"
+        
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Clip name: {clip_name}")
+        
+        # Get segment timing information
+        segment_start = _float_attr(op_seg, 'start')
+        segment_length = _float_attr(op_seg, 'length')
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Segment start: {segment_start} edit units, length: {segment_length} edit units")
+        
+        inv_edit_rate = 1.0 / edit_rate  # multiply instead of dividing for each seconds conversion
+        clip_start = timeline_position
+        source_start = segment_start * inv_edit_rate
+        clip_length = segment_length * inv_edit_rate if segment_length > 0 else 0.0
+        source_length = clip_length
+        
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Clip timeline: start={clip_start:.3f}s, length={clip_length:.3f}s")
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Clip source: start={source_start:.3f}s, length={source_length:.3f}s")
+        
+        # Use essence_id for embedded path if we found it, otherwise use source_id
+        embedded_id = essence_id if essence_id else source_id
+        embedded_path = embedded_prefix + embedded_id
+        # playback_clip = PlaybackClip(
+            # name=clip_name,
+            # file_path=embedded_path,
+            # start_time=source_start,
+            # duration=source_length,
+            # track_index=track_index,
+            # timeline_start=clip_start,
+            # timeline_end=clip_start + clip_length,
+            # source_in=source_start,
+            # source_out=source_start + source_length
+        # )
+        # playback_clips.append(playback_clip)
+        # Track by composition MOB (and essence MOB, if found) to avoid duplicates
+        processed_sources.update((source_id, essence_id) if essence_id else (source_id,))
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Added clip: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s")
+        
+        if segment_length > 0:
+            timeline_position += segment_length * inv_edit_rate
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Updated timeline position to {timeline_position:.3f}s")
+    
+    return timeline_position
+
+
+def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_file_path, track_index, timeline_position, edit_rate, depth=0, slot_idx=0, validation_clip_map=None, essence_mob_cache=None,
+                              embedded_prefix=None):
     """ARCHIVED: Disabled due to aaf2 library limitations"""
     return
-    # Original implementation commented out - see git history
-    # if validation_clip_map is None:
-    #     validation_clip_map = {}
-    # if essence_mob_cache is None:
-    #     essence_mob_cache = {}
-    # import sys
-    # indent = "  " * depth
-    # 
-    # # Limit recursion depth to prevent infinite loops and performance issues
-    # MAX_DEPTH = 20
-    # if depth > MAX_DEPTH:
-    #     _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Max recursion depth ({MAX_DEPTH}) reached, stopping", verbose_only=True)
-    #     return
+    # Original implementation kept below (unreachable) - see git history
+    # Limit recursion depth to prevent infinite loops and performance issues
+    # (checked first so an over-deep call returns before any per-level setup)
+    if depth > _MAX_TRACK_DEPTH:
+        if DEBUG_VERBOSE:
+            _debug_print(f"{'  ' * depth}DEBUG: [{slot_idx}/T{track_index}] Max recursion depth ({_MAX_TRACK_DEPTH}) reached, stopping")
+        return
+    
+    if validation_clip_map is None:
+        validation_clip_map = {}
+    if essence_mob_cache is None:
+        essence_mob_cache = {}
+    if embedded_prefix is None:
+        embedded_prefix = f"EMBEDDED:{aaf_file_path}:"
+    # Debug prefix is built once per recursion level and passed down to _process_op_segment
+    indent = "  " * depth
+    log_prefix = f"{indent}DEBUG: [{slot_idx}/T{track_index}]"
+    inv_edit_rate = 1.0 / edit_rate  # multiply instead of dividing for each seconds conversion
     
     try:
         segment_type = type(segment).__name__
         segment_name = getattr(segment, 'name', 'Unnamed')
-        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Processing segment: {segment_name} (type: {segment_type}) at {timeline_position:.3f}s", verbose_only=True)
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Processing segment: {segment_name} (type: {segment_type}) at {timeline_position:.3f}s")
         
         # Check if this is a SourceClip
         # Also check if this is an OperationGroup that might contain SourceClips
         is_operation_group = segment_type == 'OperationGroup'
         
-        if hasattr(segment, 'mob') and segment.mob is not None:
+        if _caps(segment) & _CAP_MOB and segment.mob is not None:
             source_mob = segment.mob
-            source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
+            source_id = _mob_id_str(source_mob)
             
-            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found SourceClip with MOB: {source_id}", verbose_only=True)
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Found SourceClip with MOB: {source_id}")
             
             if source_id in processed_sources:
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] SourceClip {source_id} already processed, skipping", verbose_only=True)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} SourceClip {source_id} already processed, skipping")
                 return
             
             # Get clip name
@@ -2128,51 +2129,17 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
             if not clip_name:
                 clip_name = f"Clip_{len(playback_clips) + 1}"
             
-            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip name: {clip_name}", verbose_only=True)
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Clip name: {clip_name}")
             
             # Get segment timing information
-            segment_start = 0.0
-            segment_length = 0.0
-            try:
-                if hasattr(segment, 'start'):
-                    segment_start = float(getattr(segment, 'start', 0))
-                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Segment start: {segment_start} edit units", verbose_only=True)
-                if hasattr(segment, 'length'):
-                    segment_length = float(getattr(segment, 'length', 0))
-                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Segment length: {segment_length} edit units", verbose_only=True)
-            except Exception as e:
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Could not get segment timing: {e}", verbose_only=True)
-            
-            # Check if embedded
-            is_embedded = False
-            try:
-                if hasattr(source_mob, 'descriptor'):
-                    descriptor = source_mob.descriptor
-                    if hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                        is_embedded = True
-                if not is_embedded and hasattr(source_mob, 'essence'):
-                    is_embedded = True
-            except Exception:
-                pass
-            
-            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Is embedded: {is_embedded}", verbose_only=True)
+            segment_start = _float_attr(segment, 'start')
+            segment_length = _float_attr(segment, 'length')
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Segment start: {segment_start} edit units, length: {segment_length} edit units")
             
-            # FINAL VERIFICATION: Always double-check the MOB for external locators
-            if is_embedded:
-                import sys
-                essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-                msg = f"DEBUG: [{slot_idx}/T{track_index}] Running final verification for clip '{clip_name}' (source_id={source_id})"
-                print(msg, file=sys.stderr, flush=True)
-                if _DEBUG_FILE:
-                    _DEBUG_FILE.write(msg + "\n")
-                    _DEBUG_FILE.flush()
-                is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                if not is_embedded:
-                    msg = f"DEBUG: [{slot_idx}/T{track_index}] REJECTED clip '{clip_name}' (source_id={source_id}): Final verification failed - MOB has external locator"
-                    print(msg, file=sys.stderr, flush=True)
-                    if _DEBUG_FILE:
-                        _DEBUG_FILE.write(msg + "\n")
-                        _DEBUG_FILE.flush()
+            # Check if embedded (same resolution as the OperationGroup paths)
+            is_embedded = _resolve_is_embedded(source_mob, source_id, validation_clip_map, essence_mob_cache, log_prefix)[0]
             
             # Only process embedded clips
             if is_embedded:
@@ -2182,14 +2149,16 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                 # segment_length is the clip duration (in edit units)
                 
                 clip_start = timeline_position  # Position on timeline (already in seconds)
-                source_start = segment_start / edit_rate  # Source file offset (convert to seconds)
-                clip_length = segment_length / edit_rate if segment_length > 0 else 0.0  # Clip duration (convert to seconds)
+                source_start = segment_start * inv_edit_rate  # Source file offset (convert to seconds)
+                clip_length = segment_length * inv_edit_rate if segment_length > 0 else 0.0  # Clip duration (convert to seconds)
                 source_length = clip_length
                 
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip timeline: start={clip_start:.3f}s, length={clip_length:.3f}s", verbose_only=True)
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip source: start={source_start:.3f}s, length={source_length:.3f}s", verbose_only=True)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} Clip timeline: start={clip_start:.3f}s, length={clip_length:.3f}s")
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} Clip source: start={source_start:.3f}s, length={source_length:.3f}s")
                 
-                embedded_path = f"EMBEDDED:{aaf_file_path}:{source_id}"
+                embedded_path = embedded_prefix + source_id
                 # playback_clip = PlaybackClip(
                     # name=clip_name,
                     # file_path=embedded_path,
@@ -2202,519 +2171,107 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                     # source_out=source_start + source_length
                 # )
                 # playback_clips.append(playback_clip)
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Added clip: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s", verbose_only=True)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} Added clip: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s")
                 
                 # Update timeline position for next clip (if sequential)
                 # But note: clips might overlap, so we don't always advance
                 if segment_length > 0:
-                    timeline_position += segment_length / edit_rate
-                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Updated timeline position to {timeline_position:.3f}s", verbose_only=True)
+                    timeline_position += segment_length * inv_edit_rate
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"{log_prefix} Updated timeline position to {timeline_position:.3f}s")
         
         # For OperationGroups, check segments first (they have segments, not components)
-        if is_operation_group and hasattr(segment, 'segments'):
+        if is_operation_group and _caps(segment) & _CAP_SEGMENTS:
             try:
-                op_segments = list(segment.segments) if hasattr(segment.segments, '__iter__') else []
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup (as segment) has {len(op_segments)} segment(s)", verbose_only=True)
+                op_segments = _iterable(segment.segments)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} OperationGroup (as segment) has {len(op_segments)} segment(s)")
                 for seg_idx, op_seg in enumerate(op_segments):
-                    seg_type = type(op_seg).__name__
-                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup segment {seg_idx}: type={seg_type}", verbose_only=True)
-                    
-                    # Recursively search nested OperationGroups
-                    if seg_type == 'OperationGroup':
-                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Nested OperationGroup in segment, recursively searching...", verbose_only=True)
-                        _extract_clips_from_track(op_seg, playback_clips, processed_sources,
-                                                 aaf_file_path, track_index, timeline_position, edit_rate, depth + 1, slot_idx, validation_clip_map)
-                        continue
-                    
-                    # Check if this segment is a SourceClip
-                    if hasattr(op_seg, 'mob') and op_seg.mob is not None:
-                        source_mob = op_seg.mob
-                        source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
-                        
-                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found SourceClip in OperationGroup segment {seg_idx}: {source_id}", verbose_only=True)
-                        
-                        # Note: We allow the same clip to appear multiple times on the timeline
-                        # (same audio file can be used in multiple places)
-                        # Get clip name
-                        clip_name = getattr(op_seg, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
-                        if not clip_name:
-                            clip_name = f"Clip_{len(playback_clips) + 1}"
-                        
-                        # Get segment timing
-                        segment_start = 0.0
-                        segment_length = 0.0
-                        try:
-                            if hasattr(op_seg, 'start'):
-                                segment_start = float(getattr(op_seg, 'start', 0))
-                            if hasattr(op_seg, 'length'):
-                                segment_length = float(getattr(op_seg, 'length', 0))
-                        except Exception:
-                            pass
-                        
-                        # Match with validation clips - use comprehensive matching like in the component processing
-                        is_embedded = False
-                        matched_validation_clip = None
-                        # Use cache to avoid repeated essence MOB lookups
-                        source_id_key = str(source_id)
-                        if source_id_key in essence_mob_cache:
-                            essence_mob = essence_mob_cache[source_id_key]
-                        else:
-                            essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-                            if essence_mob:
-                                essence_mob_cache[source_id_key] = essence_mob
-                        essence_id = None
-                        if essence_mob:
-                            essence_id = str(getattr(essence_mob, 'mob_id', id(essence_mob)))
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found Essence MOB: {essence_id}", verbose_only=True)
-                        
-                        # Try multiple ways to match (same as component processing)
-                        if essence_id:
-                            if essence_id in validation_clip_map:
-                                matched_validation_clip = validation_clip_map[essence_id]
-                                is_embedded = matched_validation_clip.is_embedded
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by essence_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                            elif essence_id.strip() in validation_clip_map:
-                                matched_validation_clip = validation_clip_map[essence_id.strip()]
-                                is_embedded = matched_validation_clip.is_embedded
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by normalized essence_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                        
-                        # Fallback: try source_id
-                        if not matched_validation_clip:
-                            if source_id in validation_clip_map:
-                                matched_validation_clip = validation_clip_map[source_id]
-                                is_embedded = matched_validation_clip.is_embedded
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by source_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                            elif source_id.strip() in validation_clip_map:
-                                matched_validation_clip = validation_clip_map[source_id.strip()]
-                                is_embedded = matched_validation_clip.is_embedded
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by normalized source_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                        
-                        # If still no match, check directly
-                        if not matched_validation_clip:
-                            try:
-                                check_mob = essence_mob if essence_mob else source_mob
-                                if hasattr(check_mob, 'descriptor'):
-                                    descriptor = check_mob.descriptor
-                                    if hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                                        is_embedded = True
-                                if not is_embedded and hasattr(check_mob, 'essence'):
-                                    is_embedded = True
-                            except Exception as e:
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error checking embedded status: {e}", verbose_only=True)
-                        
-                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Is embedded: {is_embedded}", verbose_only=True)
-                        
-                        # FINAL VERIFICATION: Always double-check the essence MOB for external locators
-                        if is_embedded:
-                            import sys
-                            print(f"DEBUG: [{slot_idx}/T{track_index}] Running final verification for clip '{clip_name}' (source_id={source_id}, essence_id={essence_id})", file=sys.stderr, flush=True)
-                            is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                            if not is_embedded:
-                                print(f"DEBUG: [{slot_idx}/T{track_index}] REJECTED clip '{clip_name}' (source_id={source_id}, essence_id={essence_id}): Final verification failed - MOB has external locator", file=sys.stderr, flush=True)
-                        
-                        if is_embedded:
-                            if matched_validation_clip:
-                                clip_name = matched_validation_clip.name
-                            clip_start = timeline_position
-                            source_start = segment_start / edit_rate
-                            clip_length = segment_length / edit_rate if segment_length > 0 else 0.0
-                            
-                            embedded_id = essence_id if essence_id else source_id
-                            embedded_path = f"EMBEDDED:{aaf_file_path}:{embedded_id}"
-                            # playback_clip = PlaybackClip(
-                                # name=clip_name,
-                                # file_path=embedded_path,
-                                # start_time=source_start,
-                                # duration=clip_length,
-                                # track_index=track_index,
-                                # timeline_start=clip_start,
-                                # timeline_end=clip_start + clip_length,
-                                # source_in=source_start,
-                                # source_out=source_start + clip_length
-                            # )
-                            # playback_clips.append(playback_clip)
-                            processed_sources.add(source_id)
-                            if essence_id:
-                                processed_sources.add(essence_id)
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Added clip from OperationGroup segment: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s", verbose_only=True)
-                            
-                            if segment_length > 0:
-                                timeline_position += segment_length / edit_rate
+                    timeline_position = _process_op_segment(op_seg, seg_idx, track_index, slot_idx, timeline_position, edit_rate, aaf_file_path, playback_clips,
+                                                            processed_sources, validation_clip_map, essence_mob_cache, depth, log_prefix, embedded_prefix)
             except Exception as e:
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error processing OperationGroup segments: {e}", verbose_only=True)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} Error processing OperationGroup segments: {e}")
         
         # Process sequence components
         # For OperationGroups, we need to look inside for SourceClips
-        if hasattr(segment, 'components'):
-            components = list(segment.components) if hasattr(segment.components, '__iter__') else []
-            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Segment has {len(components)} component(s)", verbose_only=True)
+        if _caps(segment) & _CAP_COMPONENTS:
+            components = _iterable(segment.components)
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Segment has {len(components)} component(s)")
             current_pos = timeline_position
             
             # Process each component - check if it's an OperationGroup or contains SourceClips
             for comp_idx, component in enumerate(components):
                 comp_type = type(component).__name__
-                comp_length = getattr(component, 'length', 0) if hasattr(component, 'length') else 0
-                comp_length_sec = comp_length / edit_rate if comp_length > 0 else 0.0
-                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Processing component {comp_idx} (type: {comp_type}) at {current_pos:.3f}s, length={comp_length_sec:.3f}s", verbose_only=True)
+                comp_length = _float_attr(component, 'length')
+                comp_length_sec = comp_length * inv_edit_rate if comp_length > 0 else 0.0
+                if DEBUG_VERBOSE:
+                    _debug_print(f"{log_prefix} Processing component {comp_idx} (type: {comp_type}) at {current_pos:.3f}s, length={comp_length_sec:.3f}s")
                 
                 # Check if this component is an OperationGroup
                 is_comp_operation_group = comp_type == 'OperationGroup'
                 
                 # For OperationGroups, check if segments contain SourceClips
                 if is_comp_operation_group:
-                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Detected OperationGroup, inspecting structure...", verbose_only=True)
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"{log_prefix} Detected OperationGroup, inspecting structure...")
                     
                     # OperationGroups have 'segments' attribute, not 'components'
                     # Check segments for SourceClips
-                    if hasattr(component, 'segments'):
+                    if _caps(component) & _CAP_SEGMENTS:
                         try:
-                            op_segments = list(component.segments) if hasattr(component.segments, '__iter__') else []
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup has {len(op_segments)} segment(s)", verbose_only=True)
+                            op_segments = _iterable(component.segments)
+                            if DEBUG_VERBOSE:
+                                _debug_print(f"{log_prefix} OperationGroup has {len(op_segments)} segment(s)")
                             
                             for seg_idx, op_seg in enumerate(op_segments):
-                                seg_type = type(op_seg).__name__
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup segment {seg_idx}: type={seg_type}", verbose_only=True)
-                                
-                                # If this segment is another OperationGroup, recursively search it
-                                if seg_type == 'OperationGroup':
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Nested OperationGroup found, recursively searching...", verbose_only=True)
-                                    _extract_clips_from_track(op_seg, playback_clips, processed_sources,
-                                                             aaf_file_path, track_index, current_pos, edit_rate, depth + 1, slot_idx, validation_clip_map)
-                                    continue
-                                
-                                # Check if this segment is a SourceClip (has mob attribute)
-                                if hasattr(op_seg, 'mob') and op_seg.mob is not None:
-                                    source_mob = op_seg.mob
-                                    source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
-                                    
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found SourceClip in OperationGroup segment {seg_idx}: {source_id}", verbose_only=True)
-                                    
-                                    # Note: We allow the same clip to appear multiple times on the timeline
-                                    # Get clip name
-                                    clip_name = getattr(op_seg, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
-                                    if not clip_name:
-                                        clip_name = f"Clip_{len(playback_clips) + 1}"
-                                    
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip name: {clip_name}", verbose_only=True)
-                                    
-                                    # Get segment timing information
-                                    segment_start = 0.0
-                                    segment_length = 0.0
-                                    try:
-                                        if hasattr(op_seg, 'start'):
-                                            segment_start = float(getattr(op_seg, 'start', 0))
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Segment start: {segment_start} edit units", verbose_only=True)
-                                        if hasattr(op_seg, 'length'):
-                                            segment_length = float(getattr(op_seg, 'length', 0))
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Segment length: {segment_length} edit units", verbose_only=True)
-                                    except Exception as e:
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Could not get segment timing: {e}", verbose_only=True)
-                                    
-                                    # Check if embedded - use validation parser's determination
-                                    # Match this SourceClip with validation clips by finding the Essence MOB
-                                    is_embedded = False
-                                    matched_validation_clip = None
-                                    
-                                    # Debug: show what we're trying to match
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Attempting to match source_id='{source_id}' (type: {type(source_id).__name__})", verbose_only=True)
-                                    if validation_clip_map:
-                                        sample_keys = list(validation_clip_map.keys())[:3]
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Sample validation_clip_map keys: {sample_keys}", verbose_only=True)
-                                    
-                                    # CRITICAL: Follow the MOB reference chain to find the Essence MOB
-                                    # The source_mob is a Composition MOB, we need to find the Essence MOB it references
-                                    essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-                                    essence_id = None
-                                    if essence_mob:
-                                        essence_id = str(getattr(essence_mob, 'mob_id', id(essence_mob)))
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found Essence MOB: {essence_id}", verbose_only=True)
-                                    
-                                    # Try multiple ways to match
-                                    # 1. Try matching by Essence MOB ID (most reliable)
-                                    if essence_id:
-                                        if essence_id in validation_clip_map:
-                                            matched_validation_clip = validation_clip_map[essence_id]
-                                            is_embedded = matched_validation_clip.is_embedded
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by essence_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                            # VERIFY: Double-check for external locator even if validation says embedded
-                                            if is_embedded and essence_mob and hasattr(essence_mob, 'descriptor'):
-                                                try:
-                                                    desc = essence_mob.descriptor
-                                                    if hasattr(desc, 'locator') and desc.locator:
-                                                        is_embedded = False
-                                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Overriding: Essence MOB has external locator, not embedded", verbose_only=True)
-                                                except Exception:
-                                                    pass
-                                        else:
-                                            # Try normalized essence_id
-                                            normalized_essence_id = essence_id.strip()
-                                            if normalized_essence_id in validation_clip_map:
-                                                matched_validation_clip = validation_clip_map[normalized_essence_id]
-                                                is_embedded = matched_validation_clip.is_embedded
-                                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by normalized essence_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                                # VERIFY: Double-check for external locator even if validation says embedded
-                                                if is_embedded and essence_mob and hasattr(essence_mob, 'descriptor'):
-                                                    try:
-                                                        desc = essence_mob.descriptor
-                                                        if hasattr(desc, 'locator') and desc.locator:
-                                                            is_embedded = False
-                                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Overriding: Essence MOB has external locator, not embedded", verbose_only=True)
-                                                    except Exception:
-                                                        pass
-                                    
-                                    # 2. Fallback: Direct match by source_id (Composition MOB)
-                                    if not matched_validation_clip:
-                                        if source_id in validation_clip_map:
-                                            matched_validation_clip = validation_clip_map[source_id]
-                                            is_embedded = matched_validation_clip.is_embedded
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by source_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                            # VERIFY: Double-check for external locator
-                                            check_mob = essence_mob if essence_mob else source_mob
-                                            if is_embedded and hasattr(check_mob, 'descriptor'):
-                                                try:
-                                                    desc = check_mob.descriptor
-                                                    if hasattr(desc, 'locator') and desc.locator:
-                                                        is_embedded = False
-                                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Overriding: MOB has external locator, not embedded", verbose_only=True)
-                                                except Exception:
-                                                    pass
-                                        else:
-                                            # 3. Try normalized source_id (strip whitespace)
-                                            normalized_source_id = source_id.strip()
-                                            if normalized_source_id in validation_clip_map:
-                                                matched_validation_clip = validation_clip_map[normalized_source_id]
-                                                is_embedded = matched_validation_clip.is_embedded
-                                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by normalized source_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                                # VERIFY: Double-check for external locator
-                                                check_mob = essence_mob if essence_mob else source_mob
-                                                if is_embedded and hasattr(check_mob, 'descriptor'):
-                                                    try:
-                                                        desc = check_mob.descriptor
-                                                        if hasattr(desc, 'locator') and desc.locator:
-                                                            is_embedded = False
-                                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Overriding: MOB has external locator, not embedded", verbose_only=True)
-                                                    except Exception:
-                                                        pass
-                                            else:
-                                                # 4. Try to get mob_id in different formats
-                                                try:
-                                                    # Try getting mob_id as a property (might be a UMID object)
-                                                    mob_id_obj = getattr(source_mob, 'mob_id', None)
-                                                    if mob_id_obj:
-                                                        # Try as string
-                                                        mob_id_str = str(mob_id_obj)
-                                                        if mob_id_str in validation_clip_map:
-                                                            matched_validation_clip = validation_clip_map[mob_id_str]
-                                                            is_embedded = matched_validation_clip.is_embedded
-                                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by mob_id string: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                                        # Try normalized mob_id_str
-                                                        elif mob_id_str.strip() in validation_clip_map:
-                                                            matched_validation_clip = validation_clip_map[mob_id_str.strip()]
-                                                            is_embedded = matched_validation_clip.is_embedded
-                                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by normalized mob_id: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                                        # Try as repr (in case it's an object)
-                                                        elif repr(mob_id_obj) in validation_clip_map:
-                                                            matched_validation_clip = validation_clip_map[repr(mob_id_obj)]
-                                                            is_embedded = matched_validation_clip.is_embedded
-                                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Matched validation clip by mob_id repr: {matched_validation_clip.name}, embedded={is_embedded}", verbose_only=True)
-                                                except Exception as e:
-                                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error trying mob_id formats: {e}", verbose_only=True)
-                                                
-                                                # 5. If still no match, check directly (same logic as validation parser)
-                                                if not matched_validation_clip:
-                                                    try:
-                                                        # Check the essence MOB if we found one
-                                                        check_mob = essence_mob if essence_mob else source_mob
-                                                        if hasattr(check_mob, 'descriptor'):
-                                                            descriptor = check_mob.descriptor
-                                                            # CRITICAL: Check for locator FIRST (external file) - if it exists, NOT embedded
-                                                            external_path = None
-                                                            if hasattr(descriptor, 'locator') and descriptor.locator:
-                                                                locator = descriptor.locator
-                                                                if locator:
-                                                                    if hasattr(locator, 'path'):
-                                                                        external_path = str(locator.path)
-                                                                    elif hasattr(locator, 'url_string'):
-                                                                        url = str(locator.url_string)
-                                                                        if url.startswith('file://'):
-                                                                            external_path = url[7:]
-                                                                        elif not url.startswith('http'):
-                                                                            external_path = url
-                                                            
-                                                            # If external path exists, this is NOT embedded
-                                                            if external_path:
-                                                                is_embedded = False
-                                                            # If no external path, check for essence (embedded)
-                                                            elif hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                                                                is_embedded = True
-                                                        
-                                                        if not is_embedded and hasattr(check_mob, 'essence'):
-                                                            is_embedded = True
-                                                    except Exception as e:
-                                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error checking embedded status: {e}", verbose_only=True)
-                                    
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Is embedded: {is_embedded}", verbose_only=True)
-                                    
-                                    # FINAL VERIFICATION: Always double-check the essence MOB for external locators
-                                    # This is a safety net to catch any clips that slip through
-                                    if is_embedded:
-                                        import sys
-                                        print(f"DEBUG: [{slot_idx}/T{track_index}] Running final verification for clip '{clip_name}' (source_id={source_id}, essence_id={essence_id})", file=sys.stderr, flush=True)
-                                        is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                                        if not is_embedded:
-                                            print(f"DEBUG: [{slot_idx}/T{track_index}] REJECTED clip '{clip_name}' (source_id={source_id}, essence_id={essence_id}): Final verification failed - MOB has external locator", file=sys.stderr, flush=True)
-                                    
-                                    # Only process embedded clips
-                                    if is_embedded:
-                                        # Use validation clip name if available
-                                        if matched_validation_clip:
-                                            clip_name = matched_validation_clip.name
-                                        clip_start = current_pos
-                                        source_start = segment_start / edit_rate
-                                        clip_length = segment_length / edit_rate if segment_length > 0 else 0.0
-                                        source_length = clip_length
-                                        
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip timeline: start={clip_start:.3f}s, length={clip_length:.3f}s", verbose_only=True)
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip source: start={source_start:.3f}s, length={source_length:.3f}s", verbose_only=True)
-                                        
-                                        # Use essence_id for embedded path if we found it, otherwise use source_id
-                                        embedded_id = essence_id if essence_id else source_id
-                                        embedded_path = f"EMBEDDED:{aaf_file_path}:{embedded_id}"
-                                        # playback_clip = PlaybackClip(
-                                            # name=clip_name,
-                                            # file_path=embedded_path,
-                                            # start_time=source_start,
-                                            # duration=source_length,
-                                            # track_index=track_index,
-                                            # timeline_start=clip_start,
-                                            # timeline_end=clip_start + clip_length,
-                                            # source_in=source_start,
-                                            # source_out=source_start + source_length
-                                        # )
-                                        # playback_clips.append(playback_clip)
-                                        processed_sources.add(source_id)  # Track by composition MOB to avoid duplicates
-                                        if essence_id:
-                                            processed_sources.add(essence_id)  # Also track by essence MOB
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Added clip: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s", verbose_only=True)
-                                        
-                                        if segment_length > 0:
-                                            current_pos += segment_length / edit_rate
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Updated timeline position to {current_pos:.3f}s", verbose_only=True)
-                        except Exception as e:
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error accessing OperationGroup.segments: {e}", verbose_only=True)
-                    
-                    # Also check slots in OperationGroup (if it has any)
-                    if hasattr(component, 'slots'):
-                        try:
-                            op_slots = list(component.slots) if hasattr(component.slots, '__iter__') else []
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup has {len(op_slots)} slot(s)", verbose_only=True)
-                            for op_slot_idx, op_slot in enumerate(op_slots):
-                                if hasattr(op_slot, 'segment') and op_slot.segment:
-                                    op_slot_seg = op_slot.segment
-                                    if hasattr(op_slot_seg, 'mob') and op_slot_seg.mob is not None:
-                                        # Found SourceClip in slot!
-                                        source_mob = op_slot_seg.mob
-                                        source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found SourceClip in OperationGroup slot {op_slot_idx}: {source_id}", verbose_only=True)
+                                current_pos = _process_op_segment(op_seg, seg_idx, track_index, slot_idx, current_pos, edit_rate, aaf_file_path, playback_clips,
+                                                                  processed_sources, validation_clip_map, essence_mob_cache, depth, log_prefix, embedded_prefix)
+                        except Exception as e:
+                            if DEBUG_VERBOSE:
+                                _debug_print(f"{log_prefix} Error accessing OperationGroup.segments: {e}")
+                    
+                    # Also check slots in OperationGroup (if it has any)
+                    if _caps(component) & _CAP_SLOTS:
+                        try:
+                            op_slots = _iterable(component.slots)
+                            if DEBUG_VERBOSE:
+                                _debug_print(f"{log_prefix} OperationGroup has {len(op_slots)} slot(s)")
+                            for op_slot_idx, op_slot in enumerate(op_slots):
+                                if _caps(op_slot) & _CAP_SEGMENT and op_slot.segment:
+                                    op_slot_seg = op_slot.segment
+                                    if _caps(op_slot_seg) & _CAP_MOB and op_slot_seg.mob is not None:
+                                        # Found SourceClip in slot!
+                                        source_mob = op_slot_seg.mob
+                                        source_id = _mob_id_str(source_mob)
+                                        if DEBUG_VERBOSE:
+                                            _debug_print(f"{log_prefix} Found SourceClip in OperationGroup slot {op_slot_idx}: {source_id}")
                                         
                                         # Note: We allow the same clip to appear multiple times on the timeline
                                         clip_name = getattr(op_slot_seg, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
                                         if not clip_name:
                                             clip_name = f"Clip_{len(playback_clips) + 1}"
                                         
-                                        segment_start = 0.0
-                                        segment_length = 0.0
-                                        try:
-                                            if hasattr(op_slot_seg, 'start'):
-                                                segment_start = float(getattr(op_slot_seg, 'start', 0))
-                                            if hasattr(op_slot_seg, 'length'):
-                                                segment_length = float(getattr(op_slot_seg, 'length', 0))
-                                        except Exception:
-                                            pass
-                                        
-                                        # Check if embedded - use validation parser's determination
-                                        is_embedded = False
-                                        matched_validation_clip = None
+                                        segment_start = _float_attr(op_slot_seg, 'start')
+                                        segment_length = _float_attr(op_slot_seg, 'length')
                                         
-                                        # Follow the MOB reference chain to find the Essence MOB
-                                        essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-                                        essence_id = None
-                                        if essence_mob:
-                                            essence_id = str(getattr(essence_mob, 'mob_id', id(essence_mob)))
-                                        
-                                        # Try matching by Essence MOB ID
-                                        if essence_id and essence_id in validation_clip_map:
-                                            matched_validation_clip = validation_clip_map[essence_id]
-                                            is_embedded = matched_validation_clip.is_embedded
-                                            # VERIFY: Double-check for external locator
-                                            if is_embedded and essence_mob and hasattr(essence_mob, 'descriptor'):
-                                                try:
-                                                    desc = essence_mob.descriptor
-                                                    if hasattr(desc, 'locator') and desc.locator:
-                                                        is_embedded = False
-                                                except Exception:
-                                                    pass
-                                        elif essence_id and essence_id.strip() in validation_clip_map:
-                                            matched_validation_clip = validation_clip_map[essence_id.strip()]
-                                            is_embedded = matched_validation_clip.is_embedded
-                                            # VERIFY: Double-check for external locator
-                                            if is_embedded and essence_mob and hasattr(essence_mob, 'descriptor'):
-                                                try:
-                                                    desc = essence_mob.descriptor
-                                                    if hasattr(desc, 'locator') and desc.locator:
-                                                        is_embedded = False
-                                                except Exception:
-                                                    pass
-                                        else:
-                                            # Fallback: check directly
-                                            try:
-                                                check_mob = essence_mob if essence_mob else source_mob
-                                                if hasattr(check_mob, 'descriptor'):
-                                                    descriptor = check_mob.descriptor
-                                                    # CRITICAL: Check for locator FIRST (external file) - if it exists, NOT embedded
-                                                    external_path = None
-                                                    if hasattr(descriptor, 'locator') and descriptor.locator:
-                                                        locator = descriptor.locator
-                                                        if locator:
-                                                            if hasattr(locator, 'path'):
-                                                                external_path = str(locator.path)
-                                                            elif hasattr(locator, 'url_string'):
-                                                                url = str(locator.url_string)
-                                                                if url.startswith('file://'):
-                                                                    external_path = url[7:]
-                                                                elif not url.startswith('http'):
-                                                                    external_path = url
-                                                    
-                                                    # If external path exists, this is NOT embedded
-                                                    if external_path:
-                                                        is_embedded = False
-                                                    # If no external path, check for essence (embedded)
-                                                    elif hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                                                        is_embedded = True
-                                                if not is_embedded and hasattr(check_mob, 'essence'):
-                                                    is_embedded = True
-                                            except Exception:
-                                                pass
-                                        
-                                        # FINAL VERIFICATION: Always double-check the essence MOB for external locators
-                                        if is_embedded:
-                                            import sys
-                                            print(f"DEBUG: [{slot_idx}/T{track_index}] Running final verification for clip '{clip_name}' (source_id={source_id}, essence_id={essence_id})", file=sys.stderr, flush=True)
-                                            is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                                            if not is_embedded:
-                                                print(f"DEBUG: [{slot_idx}/T{track_index}] REJECTED clip '{clip_name}' (source_id={source_id}, essence_id={essence_id}): Final verification failed - MOB has external locator", file=sys.stderr, flush=True)
+                                        # Check if embedded - use validation parser's determination, then verify locators
+                                        is_embedded, matched_validation_clip, essence_mob, essence_id = _resolve_is_embedded(
+                                            source_mob, source_id, validation_clip_map, essence_mob_cache, log_prefix)
                                         
                                         if is_embedded:
                                             # Use validation clip name if available
                                             if matched_validation_clip:
                                                 clip_name = matched_validation_clip.name
                                             clip_start = current_pos
-                                            source_start = segment_start / edit_rate
-                                            clip_length = segment_length / edit_rate if segment_length > 0 else 0.0
+                                            source_start = segment_start * inv_edit_rate
+                                            clip_length = segment_length * inv_edit_rate if segment_length > 0 else 0.0
                                             
                                             # Use essence_id for embedded path if we found it
                                             embedded_id = essence_id if essence_id else source_id
-                                            embedded_path = f"EMBEDDED:{aaf_file_path}:{embedded_id}"
+                                            embedded_path = embedded_prefix + embedded_id
                                             # playback_clip = PlaybackClip(
                                                 # name=clip_name,
                                                 # file_path=embedded_path,
@@ -2727,19 +2284,22 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                                                 # source_out=source_start + clip_length
                                             # )
                                             # playback_clips.append(playback_clip)
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Added clip from OperationGroup slot: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s", verbose_only=True)
+                                            if DEBUG_VERBOSE:
+                                                _debug_print(f"{log_prefix} Added clip from OperationGroup slot: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s")
                                             
                                             if segment_length > 0:
-                                                current_pos += segment_length / edit_rate
+                                                current_pos += segment_length * inv_edit_rate
                         except Exception as e:
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error accessing OperationGroup.slots: {e}", verbose_only=True)
+                            if DEBUG_VERBOSE:
+                                _debug_print(f"{log_prefix} Error accessing OperationGroup.slots: {e}")
                     
                     # Continue to check if there are any nested components (for recursive search)
-                    if hasattr(component, 'components'):
+                    if _caps(component) & _CAP_COMPONENTS:
                         try:
-                            op_components = list(component.components) if hasattr(component.components, '__iter__') else []
+                            op_components = _iterable(component.components)
                             if op_components:
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup also has {len(op_components)} component(s) (nested)", verbose_only=True)
+                                if DEBUG_VERBOSE:
+                                    _debug_print(f"{log_prefix} OperationGroup also has {len(op_components)} component(s) (nested)")
                         except Exception:
                             pass
                     
@@ -2747,14 +2307,16 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                         
                         for op_comp_idx, op_component in enumerate(op_components):
                             op_comp_type = type(op_component).__name__
-                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup component {op_comp_idx}: type={op_comp_type}", verbose_only=True)
+                            if DEBUG_VERBOSE:
+                                _debug_print(f"{log_prefix} OperationGroup component {op_comp_idx}: type={op_comp_type}")
                             
                             # Check if this component is a SourceClip (has mob attribute)
-                            if hasattr(op_component, 'mob') and op_component.mob is not None:
+                            if _caps(op_component) & _CAP_MOB and op_component.mob is not None:
                                 source_mob = op_component.mob
-                                source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
+                                source_id = _mob_id_str(source_mob)
                                 
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found SourceClip in OperationGroup component {op_comp_idx}: {source_id}", verbose_only=True)
+                                if DEBUG_VERBOSE:
+                                    _debug_print(f"{log_prefix} Found SourceClip in OperationGroup component {op_comp_idx}: {source_id}")
                                 
                                 # Note: We allow the same clip to appear multiple times on the timeline
                                 # Get clip name
@@ -2762,92 +2324,18 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                                 if not clip_name:
                                     clip_name = f"Clip_{len(playback_clips) + 1}"
                                 
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip name: {clip_name}", verbose_only=True)
+                                if DEBUG_VERBOSE:
+                                    _debug_print(f"{log_prefix} Clip name: {clip_name}")
                                 
                                 # Get segment timing information
-                                segment_start = 0.0
-                                segment_length = 0.0
-                                try:
-                                    if hasattr(op_component, 'start'):
-                                        segment_start = float(getattr(op_component, 'start', 0))
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Component start: {segment_start} edit units", verbose_only=True)
-                                    if hasattr(op_component, 'length'):
-                                        segment_length = float(getattr(op_component, 'length', 0))
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Component length: {segment_length} edit units", verbose_only=True)
-                                except Exception as e:
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Could not get component timing: {e}", verbose_only=True)
+                                segment_start = _float_attr(op_component, 'start')
+                                segment_length = _float_attr(op_component, 'length')
+                                if DEBUG_VERBOSE:
+                                    _debug_print(f"{log_prefix} Component start: {segment_start} edit units, length: {segment_length} edit units")
                                 
-                                # Check if embedded - use validation parser's determination
-                                is_embedded = False
-                                matched_validation_clip = None
-                                
-                                # Follow the MOB reference chain to find the Essence MOB
-                                essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-                                essence_id = None
-                                if essence_mob:
-                                    essence_id = str(getattr(essence_mob, 'mob_id', id(essence_mob)))
-                                
-                                # Try matching by Essence MOB ID
-                                if essence_id and essence_id in validation_clip_map:
-                                    matched_validation_clip = validation_clip_map[essence_id]
-                                    is_embedded = matched_validation_clip.is_embedded
-                                    # VERIFY: Double-check for external locator
-                                    if is_embedded and essence_mob and hasattr(essence_mob, 'descriptor'):
-                                        try:
-                                            desc = essence_mob.descriptor
-                                            if hasattr(desc, 'locator') and desc.locator:
-                                                is_embedded = False
-                                        except Exception:
-                                            pass
-                                elif essence_id and essence_id.strip() in validation_clip_map:
-                                    matched_validation_clip = validation_clip_map[essence_id.strip()]
-                                    is_embedded = matched_validation_clip.is_embedded
-                                    # VERIFY: Double-check for external locator
-                                    if is_embedded and essence_mob and hasattr(essence_mob, 'descriptor'):
-                                        try:
-                                            desc = essence_mob.descriptor
-                                            if hasattr(desc, 'locator') and desc.locator:
-                                                is_embedded = False
-                                        except Exception:
-                                            pass
-                                else:
-                                    # Fallback: check directly
-                                    try:
-                                        check_mob = essence_mob if essence_mob else source_mob
-                                        if hasattr(check_mob, 'descriptor'):
-                                            descriptor = check_mob.descriptor
-                                            # CRITICAL: Check for locator FIRST (external file) - if it exists, NOT embedded
-                                            external_path = None
-                                            if hasattr(descriptor, 'locator') and descriptor.locator:
-                                                locator = descriptor.locator
-                                                if locator:
-                                                    if hasattr(locator, 'path'):
-                                                        external_path = str(locator.path)
-                                                    elif hasattr(locator, 'url_string'):
-                                                        url = str(locator.url_string)
-                                                        if url.startswith('file://'):
-                                                            external_path = url[7:]
-                                                        elif not url.startswith('http'):
-                                                            external_path = url
-                                            
-                                            # If external path exists, this is NOT embedded
-                                            if external_path:
-                                                is_embedded = False
-                                            # If no external path, check for essence (embedded)
-                                            elif hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                                                is_embedded = True
-                                        if not is_embedded and hasattr(check_mob, 'essence'):
-                                            is_embedded = True
-                                    except Exception:
-                                        pass
-                                
-                                _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Is embedded: {is_embedded}", verbose_only=True)
-                                
-                                # FINAL VERIFICATION: Always double-check the essence MOB for external locators
-                                if is_embedded:
-                                    is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                                    if not is_embedded:
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Final verification failed: MOB has external locator", verbose_only=True)
+                                # Check if embedded - use validation parser's determination, then verify locators
+                                is_embedded, matched_validation_clip, essence_mob, essence_id = _resolve_is_embedded(
+                                    source_mob, source_id, validation_clip_map, essence_mob_cache, log_prefix)
                                 
                                 # Only process embedded clips
                                 if is_embedded:
@@ -2855,16 +2343,18 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                                     if matched_validation_clip:
                                         clip_name = matched_validation_clip.name
                                     clip_start = current_pos
-                                    source_start = segment_start / edit_rate
-                                    clip_length = segment_length / edit_rate if segment_length > 0 else 0.0
+                                    source_start = segment_start * inv_edit_rate
+                                    clip_length = segment_length * inv_edit_rate if segment_length > 0 else 0.0
                                     source_length = clip_length
                                     
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip timeline: start={clip_start:.3f}s, length={clip_length:.3f}s", verbose_only=True)
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Clip source: start={source_start:.3f}s, length={source_length:.3f}s", verbose_only=True)
+                                    if DEBUG_VERBOSE:
+                                        _debug_print(f"{log_prefix} Clip timeline: start={clip_start:.3f}s, length={clip_length:.3f}s")
+                                    if DEBUG_VERBOSE:
+                                        _debug_print(f"{log_prefix} Clip source: start={source_start:.3f}s, length={source_length:.3f}s")
                                     
                                     # Use essence_id for embedded path if we found it
                                     embedded_id = essence_id if essence_id else source_id
-                                    embedded_path = f"EMBEDDED:{aaf_file_path}:{embedded_id}"
+                                    embedded_path = embedded_prefix + embedded_id
                                     # playback_clip = PlaybackClip(
                                         # name=clip_name,
                                         # file_path=embedded_path,
@@ -2878,87 +2368,52 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                                     # )
                                     # playback_clips.append(playback_clip)
                                     processed_sources.add(source_id)
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Added clip: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s", verbose_only=True)
+                                    if DEBUG_VERBOSE:
+                                        _debug_print(f"{log_prefix} Added clip: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s")
                                     
                                     if segment_length > 0:
-                                        current_pos += segment_length / edit_rate
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Updated timeline position to {current_pos:.3f}s", verbose_only=True)
+                                        current_pos += segment_length * inv_edit_rate
+                                        if DEBUG_VERBOSE:
+                                            _debug_print(f"{log_prefix} Updated timeline position to {current_pos:.3f}s")
                     
                     # Also check slots in OperationGroup
-                    if hasattr(component, 'slots'):
-                        op_slots = list(component.slots) if hasattr(component.slots, '__iter__') else []
-                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] OperationGroup has {len(op_slots)} slot(s)", verbose_only=True)
+                    if _caps(component) & _CAP_SLOTS:
+                        op_slots = _iterable(component.slots)
+                        if DEBUG_VERBOSE:
+                            _debug_print(f"{log_prefix} OperationGroup has {len(op_slots)} slot(s)")
                         for op_slot_idx, op_slot in enumerate(op_slots):
-                            if hasattr(op_slot, 'segment') and op_slot.segment:
+                            if _caps(op_slot) & _CAP_SEGMENT and op_slot.segment:
                                 op_slot_seg = op_slot.segment
-                                if hasattr(op_slot_seg, 'mob') and op_slot_seg.mob is not None:
+                                if _caps(op_slot_seg) & _CAP_MOB and op_slot_seg.mob is not None:
                                     # Found SourceClip in slot!
                                     source_mob = op_slot_seg.mob
-                                    source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
-                                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Found SourceClip in OperationGroup slot {op_slot_idx}: {source_id}", verbose_only=True)
+                                    source_id = _mob_id_str(source_mob)
+                                    if DEBUG_VERBOSE:
+                                        _debug_print(f"{log_prefix} Found SourceClip in OperationGroup slot {op_slot_idx}: {source_id}")
                                     
                                     # Note: We allow the same clip to appear multiple times on the timeline
                                     clip_name = getattr(op_slot_seg, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
                                     if not clip_name:
                                         clip_name = f"Clip_{len(playback_clips) + 1}"
                                     
-                                    segment_start = 0.0
-                                    segment_length = 0.0
-                                    try:
-                                        if hasattr(op_slot_seg, 'start'):
-                                            segment_start = float(getattr(op_slot_seg, 'start', 0))
-                                        if hasattr(op_slot_seg, 'length'):
-                                            segment_length = float(getattr(op_slot_seg, 'length', 0))
-                                    except Exception:
-                                        pass
-                                    
-                                    # Check if embedded - use validation parser's determination
-                                    is_embedded = False
-                                    matched_validation_clip = None
+                                    segment_start = _float_attr(op_slot_seg, 'start')
+                                    segment_length = _float_attr(op_slot_seg, 'length')
                                     
-                                    # Follow the MOB reference chain to find the Essence MOB
-                                    essence_mob = _find_essence_mob_from_composition_mob(source_mob)
-                                    essence_id = None
-                                    if essence_mob:
-                                        essence_id = str(getattr(essence_mob, 'mob_id', id(essence_mob)))
-                                    
-                                    # Try matching by Essence MOB ID
-                                    if essence_id and essence_id in validation_clip_map:
-                                        matched_validation_clip = validation_clip_map[essence_id]
-                                        is_embedded = matched_validation_clip.is_embedded
-                                    elif essence_id and essence_id.strip() in validation_clip_map:
-                                        matched_validation_clip = validation_clip_map[essence_id.strip()]
-                                        is_embedded = matched_validation_clip.is_embedded
-                                    else:
-                                        # Fallback: check directly
-                                        try:
-                                            check_mob = essence_mob if essence_mob else source_mob
-                                            if hasattr(check_mob, 'descriptor'):
-                                                descriptor = check_mob.descriptor
-                                                if hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                                                    is_embedded = True
-                                            if not is_embedded and hasattr(check_mob, 'essence'):
-                                                is_embedded = True
-                                        except Exception:
-                                            pass
-                                    
-                                    # FINAL VERIFICATION: Always double-check the essence MOB for external locators
-                                    if is_embedded:
-                                        is_embedded = _verify_essence_mob_is_embedded(essence_mob, source_mob)
-                                        if not is_embedded:
-                                            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Final verification failed: MOB has external locator", verbose_only=True)
+                                    # Check if embedded - use validation parser's determination, then verify locators
+                                    is_embedded, matched_validation_clip, essence_mob, essence_id = _resolve_is_embedded(
+                                        source_mob, source_id, validation_clip_map, essence_mob_cache, log_prefix)
                                     
                                     if is_embedded:
                                         # Use validation clip name if available
                                         if matched_validation_clip:
                                             clip_name = matched_validation_clip.name
                                         clip_start = current_pos
-                                        source_start = segment_start / edit_rate
-                                        clip_length = segment_length / edit_rate if segment_length > 0 else 0.0
+                                        source_start = segment_start * inv_edit_rate
+                                        clip_length = segment_length * inv_edit_rate if segment_length > 0 else 0.0
                                         
                                         # Use essence_id for embedded path if we found it
                                         embedded_id = essence_id if essence_id else source_id
-                                        embedded_path = f"EMBEDDED:{aaf_file_path}:{embedded_id}"
+                                        embedded_path = embedded_prefix + embedded_id
                                         # playback_clip = PlaybackClip(
                                             # name=clip_name,
                                             # file_path=embedded_path,
@@ -2971,208 +2426,89 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
                                             # source_out=source_start + clip_length
                                         # )
                                         # playback_clips.append(playback_clip)
-                                        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Added clip from OperationGroup slot: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s", verbose_only=True)
+                                        if DEBUG_VERBOSE:
+                                            _debug_print(f"{log_prefix} Added clip from OperationGroup slot: {clip_name} at track {track_index}, timeline {clip_start:.3f}-{clip_start + clip_length:.3f}s")
                                         
                                         if segment_length > 0:
-                                            current_pos += segment_length / edit_rate
+                                            current_pos += segment_length * inv_edit_rate
                 
                 # Always recurse into components (for nested structures and non-OperationGroups)
                 # This will catch any SourceClips we might have missed
                 _extract_clips_from_track(component, playback_clips, processed_sources,
-                                         aaf_file_path, track_index, current_pos, edit_rate, depth + 1, slot_idx, validation_clip_map)
+                                         aaf_file_path, track_index, current_pos, edit_rate, depth + 1, slot_idx, validation_clip_map, essence_mob_cache, embedded_prefix)
                 if comp_length > 0:
-                    current_pos += comp_length / edit_rate
+                    current_pos += comp_length * inv_edit_rate
         
         # Process slots (nested tracks)
-        if hasattr(segment, 'slots'):
-            slots = list(segment.slots) if hasattr(segment.slots, '__iter__') else []
-            _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Segment has {len(slots)} slot(s)", verbose_only=True)
+        if _caps(segment) & _CAP_SLOTS:
+            slots = _iterable(segment.slots)
+            if DEBUG_VERBOSE:
+                _debug_print(f"{log_prefix} Segment has {len(slots)} slot(s)")
             for nested_slot_idx, slot in enumerate(slots):
-                if hasattr(slot, 'segment') and slot.segment:
-                    slot_pos = timeline_position
-                    try:
-                        if hasattr(slot, 'start'):
-                            slot_pos = float(getattr(slot, 'start', 0)) / edit_rate
-                    except Exception:
-                        pass
-                    _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Processing nested slot {nested_slot_idx} at {slot_pos:.3f}s", verbose_only=True)
+                if _caps(slot) & _CAP_SEGMENT and slot.segment:
+                    slot_pos = _float_attr(slot, 'start', timeline_position * edit_rate) * inv_edit_rate
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"{log_prefix} Processing nested slot {nested_slot_idx} at {slot_pos:.3f}s")
                     _extract_clips_from_track(slot.segment, playback_clips, processed_sources,
-                                             aaf_file_path, track_index, slot_pos, edit_rate, depth + 1, slot_idx, validation_clip_map)
+                                             aaf_file_path, track_index, slot_pos, edit_rate, depth + 1, slot_idx, validation_clip_map, essence_mob_cache, embedded_prefix)
     
     except Exception as e:
-        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Error processing segment: {e}", verbose_only=True)
-        import traceback
-        _debug_print(f"{indent}DEBUG: [{slot_idx}/T{track_index}] Traceback: {traceback.format_exc()}", verbose_only=True)
-
-
-# def _extract_playback_from_segment(segment, playback_clips: List[PlaybackClip], processed_sources: Set[str], aaf_file_path: str):
-    # """
-    # Extracts playback information from an AAF segment.
-    # Uses the same logic as validation to find clips, then filters for playback.
-    
-    # Args:
-        # segment: AAF segment object
-        # playback_clips: List to append found clips to
-        # processed_sources: Set of processed source IDs to avoid duplicates
-        # aaf_file_path: Path to the AAF file (for resolving relative paths)
-    # """
-    # try:
-        # Check if this is a SourceClip with a MOB
-        # if hasattr(segment, 'mob') and segment.mob is not None:
-            # source_mob = segment.mob
-            # source_id = str(getattr(source_mob, 'mob_id', id(source_mob)))
-            
-            # if source_id in processed_sources:
-                # return
-            # processed_sources.add(source_id)
-            
-            # Get clip name
-            # clip_name = getattr(segment, 'name', None) or getattr(source_mob, 'name', 'Unnamed Clip')
-            # if not clip_name:
-                # clip_name = f"Clip_{len(playback_clips) + 1}"
-            
-            # Extract file path - use same logic as validation
-            # external_path = None
-            # is_embedded = False
-            
-            # try:
-                # if hasattr(source_mob, 'descriptor'):
-                    # descriptor = source_mob.descriptor
-                    
-                    # if hasattr(descriptor, 'locator'):
-                        # locator = descriptor.locator
-                        # if locator:
-                            # if hasattr(locator, 'path'):
-                                # external_path = str(locator.path)
-                            # elif hasattr(locator, 'url_string'):
-                                # url = str(locator.url_string)
-                                # if url.startswith('file://'):
-                                    # external_path = url[7:]
-                                # elif not url.startswith('http'):
-                                    # external_path = url
-                    
-                    # if hasattr(descriptor, 'essence') or hasattr(descriptor, 'essence_data'):
-                        # is_embedded = True
-                
-                # Alternative: Check for essence mobs
-                # if not external_path and not is_embedded:
-                    # if hasattr(source_mob, 'essence'):
-                        # is_embedded = True
-                
-                # Also check for file locators in the mob itself (same as validation)
-                # if not external_path:
-                    # for slot in getattr(source_mob, 'slots', []):
-                        # if hasattr(slot, 'segment'):
-                            # seg = slot.segment
-                            # if hasattr(seg, 'mob') and seg.mob:
-                                # mob = seg.mob
-                                # if hasattr(mob, 'descriptor'):
-                                    # desc = mob.descriptor
-                                    # if hasattr(desc, 'locator'):
-                                        # loc = desc.locator
-                                        # if loc and hasattr(loc, 'path'):
-                                            # external_path = str(loc.path)
-                                            # break
-                                        # elif loc and hasattr(loc, 'url_string'):
-                                            # url = str(loc.url_string)
-                                            # if url.startswith('file://'):
-                                                # external_path = url[7:]
-                                                # break
-                                            # elif not url.startswith('http'):
-                                                # external_path = url
-                                                # break
-            # except Exception:
-                # pass
-            
-            # Resolve relative paths
-            # if external_path:
-                # if not os.path.isabs(external_path):
-                    # aaf_dir = os.path.dirname(os.path.abspath(aaf_file_path))
-                    # external_path = os.path.join(aaf_dir, external_path)
-                # external_path = os.path.normpath(external_path)
-            
-            # Extract timing information if available
-            # start_time = 0.0
-            # duration = 0.0
-            
-            # try:
-                # Try to get start/end times from segment
-                # if hasattr(segment, 'start'):
-                    # start_time = float(getattr(segment, 'start', 0))
-                # if hasattr(segment, 'length'):
-                    # duration = float(getattr(segment, 'length', 0))
-                # Convert from edit units to seconds if needed (simplified)
-                # In real AAF files, this would require sample rate conversion
-            # except Exception:
-                # pass
-            
-            # ONLY add embedded clips - external clips mean the file is broken
-            # if is_embedded and not external_path:
-                # For embedded clips, use special path format
-                # embedded_path = f"EMBEDDED:{aaf_file_path}:{source_id}"
-                # playback_clip = PlaybackClip(
-                    # name=clip_name,
-                    # file_path=embedded_path,
-                    # start_time=start_time,
-                    # duration=duration
-                # )
-                # playback_clips.append(playback_clip)
-        
-        # Recursively process slots/segments
-        # if hasattr(segment, 'slots'):
-            # for slot in segment.slots:
-                # if hasattr(slot, 'segment') and slot.segment:
-                    # _extract_playback_from_segment(slot.segment, playback_clips, processed_sources, aaf_file_path)
-        
-        # if hasattr(segment, 'components'):
-            # for component in segment.components:
-                # _extract_playback_from_segment(component, playback_clips, processed_sources, aaf_file_path)
-    
-    # except Exception:
-        # pass
-# ============================================================================
-# END ARCHIVED: _extract_playback_from_segment
-# ============================================================================
+        if DEBUG_VERBOSE:
+            _debug_print(f"{log_prefix} Error processing segment: {e}")
+            _debug_print(f"{log_prefix} Traceback: {traceback.format_exc()}")
 
 
-# def _extract_playback_clips_from_omf(file_path: str) -> List[PlaybackClip]:
+def _iter_playback_clips_from_omf(file_path: str) -> Iterator[PlaybackClip]:
     """
-    Extracts playback-ready clips from an OMF file.
-    ONLY returns embedded clips - external clips mean the file is broken.
+    Yields playback-ready clips from an OMF file as they are found.
+    ONLY yields embedded clips - external clips mean the file is broken.
     
     Args:
         file_path: Path to the OMF file
         
-    Returns:
-        List[PlaybackClip]: List of clips ready for playback (embedded only)
+    Yields:
+        PlaybackClip: Clips ready for playback (embedded only)
     """
     # Use validation parser to find all clips
     try:
         validation_clips = _parse_omf_file(file_path)
     except Exception:
-        return []
+        return
+    
+    embedded_prefix = f"EMBEDDED:{file_path}:"
     
     # Convert validation clips to playback clips (ONLY embedded clips)
-    playback_clips: List[PlaybackClip] = []
     for clip in validation_clips:
         if clip.is_embedded:
             # For embedded clips, use special path format
-            embedded_path = f"EMBEDDED:{file_path}:{clip.clip_id or clip.name}"
-            # playback_clip = PlaybackClip(
-                # name=clip.name,
-                # file_path=embedded_path,
-                # start_time=0.0,
-                # duration=0.0
-            # )
-            # playback_clips.append(playback_clip)
-    
-    return playback_clips
-# ============================================================================
-# END ARCHIVED: _extract_playback_clips_from_omf
-# ============================================================================
+            yield PlaybackClip(
+                name=clip.name,
+                file_path=embedded_prefix + (clip.clip_id or clip.name),
+                start_time=0.0,
+                duration=0.0
+            )
+
+
+def iter_playback_clips(file_path: str) -> Iterator[PlaybackClip]:
+    """
+    Yields playback-ready clips from an OMF or AAF file without building the full list.
+    
+    Args:
+        file_path: Path to the OMF or AAF file
+        
+    Yields:
+        PlaybackClip: Clips ready for playback
+    """
+    file_type = _detect_file_type(file_path)
+    
+    if file_type == 'omf':
+        yield from _iter_playback_clips_from_omf(file_path)
+    # ARCHIVED: AAF playback extraction (_extract_timeline_from_composition) is disabled,
+    # so AAF files yield no clips
 
 
-# def extract_playback_clips(file_path: str) -> List[PlaybackClip]:
+# ARCHIVED: Playback mode is disabled in __main__; kept for when it is revisited
+def extract_playback_clips(file_path: str) -> List[PlaybackClip]:
     """
     Extracts playback-ready clips from an OMF or AAF file.
     
@@ -3182,14 +2518,7 @@ def _extract_clips_from_track(segment, playback_clips, processed_sources, aaf_fi
     Returns:
         List[PlaybackClip]: List of clips ready for playback
     """
-    file_type = _detect_file_type(file_path)
-    
-    if file_type == 'aaf':
-        return _extract_playback_clips_from_aaf(file_path)
-    elif file_type == 'omf':
-        return _extract_playback_clips_from_omf(file_path)
-    else:
-        return []
+    return list(iter_playback_clips(file_path))
 
 
 def validate_embedded_media(clip: MediaClip) -> bool:
@@ -3233,37 +2562,38 @@ def format_report(report: ValidationReport) -> str:
     Returns:
         str: Formatted report string
     """
-    output = []
-    output.append("=" * 60)
-    output.append("OMF/AAF Media Validation Report")
-    output.append("=" * 60)
-    output.append(f"File: {report.file_path}")
-    output.append("")
-    output.append("Summary:")
-    output.append(f"  Total Audio Clips: {report.total_clips}")
-    output.append(f"  Embedded Clips: {report.embedded_clips}")
-    output.append(f"  Linked Clips: {report.linked_clips}")
-    output.append(f"  Valid Clips: {report.valid_clips}")
-    output.append(f"  Missing/Invalid Clips: {report.missing_clips}")
-    output.append("")
+    rule = "=" * 60
+    # One string per report section / missing clip rather than one list entry per line
+    output = [
+        f"{rule}\n"
+        "OMF/AAF Media Validation Report\n"
+        f"{rule}\n"
+        f"File: {report.file_path}\n"
+        "\n"
+        "Summary:\n"
+        f"  Total Audio Clips: {report.total_clips}\n"
+        f"  Embedded Clips: {report.embedded_clips}\n"
+        f"  Linked Clips: {report.linked_clips}\n"
+        f"  Valid Clips: {report.valid_clips}\n"
+        f"  Missing/Invalid Clips: {report.missing_clips}\n"
+    ]
     
     if report.missing_clips > 0:
-        output.append("Missing/Invalid Clips Details:")
-        output.append("-" * 60)
+        output.append(f"Missing/Invalid Clips Details:\n{'-' * 60}")
         for clip in report.missing_clip_details:
-            output.append(f"  Clip: {clip.name}")
-            if clip.clip_id:
-                output.append(f"    ID: {clip.clip_id}")
-            output.append(f"    Type: {'Embedded' if clip.is_embedded else 'Linked'}")
-            if clip.external_path:
-                output.append(f"    Expected Path: {clip.external_path}")
-            if clip.error_message:
-                output.append(f"    Error: {clip.error_message}")
-            output.append("")
+            id_line = f"    ID: {clip.clip_id}\n" if clip.clip_id else ""
+            path_line = f"\n    Expected Path: {clip.external_path}" if clip.external_path else ""
+            error_line = f"\n    Error: {clip.error_message}" if clip.error_message else ""
+            output.append(
+                f"  Clip: {clip.name}\n"
+                f"{id_line}"
+                f"    Type: {'Embedded' if clip.is_embedded else 'Linked'}"
+                f"{path_line}{error_line}\n"
+            )
     else:
         output.append("✅ All audio clips are valid and accessible!")
     
-    output.append("=" * 60)
+    output.append(rule)
     return "\n".join(output)
 
 
@@ -3272,7 +2602,861 @@ def format_report(report: ValidationReport) -> str:
 # TODO: Revisit when we have a solution for extracting embedded essence data
 # Date archived: 2024-12-19
 # ============================================================================
-# def extract_embedded_audio(aaf_file_path: str, mob_id: str, output_path: str, start_time: float = 0.0, duration: float = 0.0) -> bool:
+def _find_mob_by_id(mobs, mob_id: str):
+    """
+    Finds a MOB in a content.mobs set by its string MOB ID.
+    
+    Tries aaf2's keyed lookup first (one hashed probe); falls back to scanning every MOB
+    for IDs that don't parse as a MobID or MOBs whose ID only lives in their properties.
+    """
+    try:
+        mob = mobs.get(aaf2.mobid.MobID(mob_id))
+    except Exception:
+        mob = None
+    if mob is not None:
+        return mob
+    
+    for m in (mobs.values() if hasattr(mobs, 'values') else mobs):
+        try:
+            # Try different ways to get the MOB ID
+            m_id = None
+            mid = _attr(m, 'mob_id')
+            if mid is not None:
+                m_id = str(mid)
+            else:
+                # Fallback: try to get ID from properties
+                try:
+                    props = m.properties if hasattr(m, 'properties') else {}
+                    if 'MobID' in props:
+                        m_id = str(props['MobID'])
+                except Exception:
+                    pass
+            
+            if m_id and m_id == mob_id:
+                return m
+        except Exception:
+            continue
+    return None
+
+
+# Essence MOB ID (None if there is none) resolved for each requested MOB, keyed by
+# (AAF path, mtime, requested MOB ID). aaf2 objects don't outlive their file handle,
+# so the link is kept as an ID and looked up again by key on the next extraction.
+# Entries for a file are dropped once its mtime changes, and the oldest go first when
+# the cache is full (each batch worker process holds its own copy).
+_essence_mob_id_cache: Dict[Tuple[str, int, str], Optional[str]] = {}
+_EXTRACTION_CACHE_SIZE = 256
+
+# The mtime the extraction caches were last keyed with, per AAF path
+_extraction_mtimes: Dict[str, int] = {}
+
+# (sample_rate, channels, sample_width) per extracted MOB, keyed and bounded like _essence_mob_id_cache
+_audio_properties_cache: Dict[Tuple[str, int, str], Tuple[int, int, int]] = {}
+
+
+def _extraction_cache_key(aaf_file_path: str, mob_id: str) -> Optional[Tuple[str, int, str]]:
+    """
+    Key for the per-MOB extraction caches, or None if the file can't be stat'ed.
+    
+    If the file changed since it was last keyed, its entries under the old mtime can never
+    be hit again and are dropped here.
+    """
+    try:
+        mtime_ns = os.stat(aaf_file_path).st_mtime_ns
+    except OSError:
+        return None
+    if _extraction_mtimes.get(aaf_file_path, mtime_ns) != mtime_ns:
+        for cache in (_essence_mob_id_cache, _audio_properties_cache):
+            for key in [key for key in cache if key[0] == aaf_file_path]:
+                del cache[key]
+    _extraction_mtimes[aaf_file_path] = mtime_ns
+    return (aaf_file_path, mtime_ns, mob_id)
+
+
+def _store_extraction_result(cache: dict, cache_key: Tuple[str, int, str], value):
+    """Stores value in one of the per-MOB extraction caches, dropping the oldest entry when it is full."""
+    if len(cache) >= _EXTRACTION_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[cache_key] = value
+
+
+# MOB classes that reference essence through their slots rather than describing it themselves
+_COMPOSITION_LIKE_MOB_TYPES = ('CompositionMob', 'MasterMob')
+
+
+def _is_composition_like(mob) -> bool:
+    """True if mob has to be followed to an Essence MOB (a Composition/Master MOB, or no descriptor)."""
+    return type(mob).__name__ in _COMPOSITION_LIKE_MOB_TYPES or _attr(mob, 'descriptor') is None
+
+
+def _resolve_extraction_mob(f, cache_key: Optional[Tuple[str, int, str]], mob):
+    """
+    Returns the Essence MOB that mob references, or mob itself if it has none.
+    
+    Extracting several stems from one file resolves the same Composition -> Essence links
+    repeatedly, so a link found by an earlier call on the unmodified file is reused. A MOB
+    that already carries its own descriptor (a SourceMob) is returned without a walk.
+    """
+    if not _is_composition_like(mob):
+        return mob
+    if cache_key in _essence_mob_id_cache:
+        essence_mob_id = _essence_mob_id_cache[cache_key]
+        essence_mob = _find_mob_by_id(f.content.mobs, essence_mob_id) if essence_mob_id else None
+    else:
+        essence_mob = _find_essence_mob_from_composition_mob(mob)
+        essence_mob_id = _attr(essence_mob, 'mob_id') if essence_mob else None
+        if cache_key is not None and (essence_mob is None or essence_mob_id is not None):
+            _store_extraction_result(_essence_mob_id_cache, cache_key,
+                                     str(essence_mob_id) if essence_mob_id is not None else None)
+    return essence_mob or mob
+
+
+def _audio_properties(descriptor, cache_key: Optional[Tuple[str, int, str]]) -> Tuple[int, int, int]:
+    """
+    Reads (sample_rate, channels, sample_width) from an audio descriptor, defaulting to
+    48 kHz / stereo / 16-bit for anything missing.
+    
+    Playback re-extracts the same MOB for every start_time/duration window, so the values
+    are cached per MOB of the unmodified file.
+    """
+    cached = _audio_properties_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    sample_rate = 48000  # Default
+    channels = 2  # Default
+    sample_width = 2  # 16-bit default
+    
+    try:
+        # Try to get sample rate
+        value = _attr(descriptor, 'sample_rate') or _attr(descriptor, 'AudioSamplingRate')
+        if value:
+            sample_rate = int(value)
+        
+        # Try to get channels
+        value = _attr(descriptor, 'channels') or _attr(descriptor, 'AudioChannelCount')
+        if value:
+            channels = int(value)
+        
+        # Try to get bit depth
+        value = _attr(descriptor, 'bits_per_sample') or _attr(descriptor, 'AudioBitsPerSample')
+        if value:
+            sample_width = int(value) // 8
+    except Exception as e:
+        print(f"Warning: Could not read all audio properties, using defaults: {e}", file=sys.stderr)
+        return sample_rate, channels, sample_width
+    
+    properties = (sample_rate, channels, sample_width)
+    if cache_key is not None:
+        _store_extraction_result(_audio_properties_cache, cache_key, properties)
+    return properties
+
+
+def _probe_descriptor_essence(f, mob, descriptor, mob_id):
+    """Methods 1-3: essence stored directly on the descriptor."""
+    for name in ('essence', 'essence_data', 'essence_access'):
+        try:
+            essence_data = _attr(descriptor, name)
+            if essence_data:
+                return essence_data, f"descriptor.{name}"
+        except Exception as e:
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error accessing descriptor.{name}: {e}")
+    return None, None
+
+
+def _probe_mob_essence(f, mob, descriptor, mob_id):
+    """Method 4: essence on the MOB itself."""
+    try:
+        essence_data = _attr(mob, 'essence')
+        if essence_data:
+            return essence_data, "mob.essence"
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing mob.essence: {e}")
+    return None, None
+
+
+def _probe_slot_essence(f, mob, descriptor, mob_id):
+    """Method 5: essence reached through the MOB's slots (slot segments, their MOBs, or slot readers)."""
+    if not hasattr(mob, 'slots'):
+        return None, None
+    try:
+        slot_list = list(mob.slots) if hasattr(mob.slots, '__iter__') else []
+        for slot in slot_list:
+            seg = _attr(slot, 'segment')
+            if seg:
+                # Check if segment has essence
+                seg_mob = _attr(seg, 'mob')
+                if seg_mob:
+                    seg_desc = _attr(seg_mob, 'descriptor')
+                    for name in ('essence', 'essence_data'):
+                        try:
+                            essence_data = _attr(seg_desc, name)
+                            if essence_data:
+                                return essence_data, f"slot.segment.mob.descriptor.{name}"
+                        except Exception:
+                            pass
+                
+                # Also try to read essence data directly from slot if it has a reader
+                if hasattr(slot, 'read'):
+                    try:
+                        slot_data = slot.read()
+                        if slot_data:
+                            return slot_data, "slot.read()"
+                    except Exception:
+                        pass
+                
+                # Try accessing essence through slot's segment directly
+                try:
+                    essence_data = _attr(seg, 'essence')
+                    if essence_data:
+                        return essence_data, "slot.segment.essence"
+                except Exception:
+                    pass
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing MOB slots: {e}")
+    return None, None
+
+
+def _probe_essence_stream(f, mob, descriptor, mob_id):
+    """Method 6: aaf2's stream/reader API."""
+    try:
+        # Some AAF files store essence in a stream that needs to be opened
+        if hasattr(f, 'open_essence'):
+            try:
+                essence_stream = f.open_essence(mob)
+                if essence_stream:
+                    return essence_stream, "aaf2.open_essence"
+            except Exception as e:
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error with aaf2.open_essence: {e}")
+        
+        # Try reading essence using file's read method if available
+        if hasattr(f, 'read'):
+            try:
+                # Some aaf2 files allow reading essence directly
+                if hasattr(f, 'read_essence'):
+                    essence_data = f.read_essence(mob)
+                    if essence_data:
+                        return essence_data, "aaf2.read_essence(mob)"
+            except Exception as e:
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error with aaf2.read_essence: {e}")
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error trying aaf2 stream API: {e}")
+    return None, None
+
+
+def _probe_descriptor_properties(f, mob, descriptor, mob_id):
+    """Method 7: essence stored under one of the descriptor's property keys."""
+    try:
+        # Some descriptors store essence in properties
+        if hasattr(descriptor, 'properties'):
+            props = descriptor.properties
+            # Handle case where properties is a method that needs to be called
+            if callable(props):
+                try:
+                    props = props()
+                except Exception as e:
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Error calling descriptor.properties(): {e}")
+                    props = None
+            
+            # Now check if props is a dict-like object
+            if props is not None and hasattr(props, '__getitem__'):
+                for key in ['EssenceData', 'Essence', 'Data', 'AudioData']:
+                    try:
+                        if key in props:
+                            essence_data = props[key]
+                            if essence_data:
+                                return essence_data, f"descriptor.properties[{key}]"
+                    except (KeyError, TypeError, AttributeError):
+                        pass
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing descriptor properties: {e}")
+    return None, None
+
+
+def _probe_file_essence_container(f, mob, descriptor, mob_id):
+    """Method 8: the file's essence container, keyed by MOB ID."""
+    try:
+        # AAF files may store essence in a separate container
+        essence_container = _attr(f, 'essence')
+        if essence_container:
+            try:
+                # Try to get essence by MOB ID
+                if hasattr(essence_container, 'get'):
+                    essence_data = essence_container.get(mob_id, None)
+                    if essence_data:
+                        return essence_data, "file.essence.get(mob_id)"
+            except Exception as e:
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error accessing file.essence: {e}")
+        
+        # Also try essence_data attribute
+        if hasattr(f, 'essence_data'):
+            try:
+                essence_data = f.essence_data
+                if essence_data:
+                    return essence_data, "file.essence_data"
+            except Exception as e:
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error accessing file.essence_data: {e}")
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing file essence container: {e}")
+    return None, None
+
+
+def _probe_file_stream(f, mob, descriptor, mob_id):
+    """
+    Methods 9-10: essence attribute exists but is None, so try reading it through the file
+    (its stream, the MOB found again by ID, or the file's essence storage).
+    """
+    if not (hasattr(descriptor, 'essence') or hasattr(mob, 'essence')):
+        return None, None
+    try:
+        # Try to use the file's stream to read essence data
+        # Some AAF files store essence data that needs to be read through the file stream
+        stream = _attr(f, 'stream')
+        if stream:
+            try:
+                # Try to get stream for this MOB
+                if hasattr(stream, 'read_essence'):
+                    essence_data = stream.read_essence(mob)
+                    if essence_data:
+                        return essence_data, "file.stream.read_essence(mob)"
+            except Exception as e:
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error with file.stream.read_essence: {e}")
+        
+        # Also try reading essence directly from file using MOB ID
+        if mob_id:
+            try:
+                # Try to find essence data in file by MOB ID
+                # Some AAF files store essence indexed by MOB ID
+                if hasattr(f, 'content') and f.content:
+                    # Try to find essence MOB in file content
+                    try:
+                        # Look for essence MOBs in the file
+                        if hasattr(f.content, 'mobs'):
+                            mobs = f.content.mobs
+                            if hasattr(mobs, '__iter__'):
+                                for file_mob in mobs:
+                                    try:
+                                        if hasattr(file_mob, 'mob_id'):
+                                            file_mob_id = str(file_mob.mob_id)
+                                            if file_mob_id == mob_id:
+                                                # Found the MOB, try to get essence
+                                                essence_val = _attr(file_mob, 'essence')
+                                                if essence_val:
+                                                    return essence_val, "file.content.mobs[mob_id].essence"
+                                    except Exception:
+                                        continue
+                    except Exception as e:
+                        if DEBUG_VERBOSE:
+                            _debug_print(f"DEBUG: Error searching file.content.mobs: {e}")
+            except Exception as e:
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error accessing file content by MOB ID: {e}")
+        
+        # Method 10: Try to read essence data from file's essence storage directly
+        # When mob.essence is None, the data might be in the file's essence container
+        try:
+            # Try to access file's essence storage
+            essence_storage = _attr(f, 'essence') or _attr(f.content, 'essence')
+            if essence_storage:
+                # Try to get essence by MOB
+                if hasattr(essence_storage, 'get'):
+                    try:
+                        essence_data = essence_storage.get(mob, None)
+                        if essence_data:
+                            return essence_data, "file.essence.get(mob)"
+                    except Exception:
+                        pass
+                
+                # Try iterating through essence storage
+                if hasattr(essence_storage, '__iter__'):
+                    try:
+                        for essence_item in essence_storage:
+                            # Try to match by MOB or MOB ID
+                            if hasattr(essence_item, 'mob') and essence_item.mob == mob:
+                                if hasattr(essence_item, 'data'):
+                                    return essence_item.data, "file.essence[item].data"
+                            elif hasattr(essence_item, 'mob_id'):
+                                item_mob_id = str(essence_item.mob_id)
+                                if item_mob_id == mob_id:
+                                    if hasattr(essence_item, 'data'):
+                                        return essence_item.data, "file.essence[item].data (by ID)"
+                    except Exception as e:
+                        if DEBUG_VERBOSE:
+                            _debug_print(f"DEBUG: Error iterating essence storage: {e}")
+        except Exception as e:
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error accessing file essence storage: {e}")
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing file stream: {e}")
+    return None, None
+
+
+# Essence probes in the order extract_embedded_audio tries them
+_ESSENCE_PROBES = (
+    _probe_descriptor_essence,
+    _probe_mob_essence,
+    _probe_slot_essence,
+    _probe_essence_stream,
+    _probe_descriptor_properties,
+    _probe_file_essence_container,
+    _probe_file_stream,
+)
+
+# Descriptor classes whose embedded essence is only ever reachable from the descriptor or the
+# MOB itself (the first two probes); the slot walk and file-level probes can't find it
+_INLINE_ESSENCE_DESCRIPTOR_TYPES = ('PCMDescriptor', 'WAVEDescriptor', 'AIFCDescriptor')
+_INLINE_ESSENCE_PROBES = _ESSENCE_PROBES[:2]
+
+# The probe that last found essence for each descriptor class
+_essence_probe_cache: Dict[type, object] = {}
+
+
+def _find_essence_data(f, mob, descriptor, mob_id: str):
+    """
+    Finds the embedded essence for a MOB, returning (essence_data, source description) or (None, None).
+    
+    Only one probe works for a given descriptor class, so the one that succeeded last time is
+    tried first and the full chain only runs when it comes up empty. PCM/WAVE/AIFC descriptors
+    stop after the descriptor and MOB probes.
+    """
+    descriptor_type = type(descriptor)
+    cached_probe = _essence_probe_cache.get(descriptor_type)
+    if cached_probe is not None:
+        essence_data, essence_source = cached_probe(f, mob, descriptor, mob_id)
+        if essence_data:
+            return essence_data, essence_source
+    
+    if descriptor_type.__name__ in _INLINE_ESSENCE_DESCRIPTOR_TYPES:
+        probes = _INLINE_ESSENCE_PROBES
+    else:
+        probes = _ESSENCE_PROBES
+    for probe in probes:
+        if probe is cached_probe:
+            continue
+        essence_data, essence_source = probe(f, mob, descriptor, mob_id)
+        if essence_data:
+            _essence_probe_cache[descriptor_type] = probe
+            return essence_data, essence_source
+    return None, None
+
+
+def _to_audio_bytes(value):
+    """
+    Normalizes a reader's result to a bytes-like object, or None (for None, str, and
+    anything that is neither a buffer nor iterable).
+    
+    bytes and bytearray pass through untouched. Other buffer-protocol objects come back as
+    a flat byte memoryview over the same memory rather than a copy; the trimming and WAV
+    writing downstream take views as they are. Only plain iterables of ints are copied.
+    """
+    value_type = type(value)
+    if value_type is bytes or value_type is bytearray:
+        return value
+    if value is None or isinstance(value, str):
+        return None
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return bytes(value) if hasattr(value, '__iter__') else None
+    if not view.c_contiguous:
+        return view.tobytes()
+    return view if view.format == 'B' and view.ndim == 1 else view.cast('B')
+
+
+def _rewind(stream):
+    """Seeks a stream back to its start, if it can seek at all."""
+    try:
+        stream.seek(0)
+    except (AttributeError, OSError):
+        pass
+
+
+def _read_presized(stream) -> Optional[bytearray]:
+    """
+    Reads a whole seekable stream with readinto() into a bytearray sized from its length, so
+    the payload isn't regrown as an open-ended read() would. Returns None (with the stream
+    back at its start) if the stream can't report its length or has no readinto().
+    """
+    readinto = getattr(stream, 'readinto', None)
+    if readinto is None:
+        return None
+    try:
+        stream.seek(0, 2)
+        total = stream.tell()
+        stream.seek(0)
+    except (AttributeError, OSError, TypeError):
+        return None
+    if not total:
+        return None
+    
+    buffer = bytearray(total)
+    view = memoryview(buffer)
+    filled = 0
+    while filled < total:
+        count = readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return buffer if filled == total else buffer[:filled]
+
+
+def _read_file_like(f, mob, essence_data):
+    """Method 1 (and 8, for aaf2 Stream/Reader classes): file-like object with read()."""
+    if hasattr(essence_data, 'read'):
+        try:
+            # The streaming attempt may already have consumed it
+            _rewind(essence_data)
+            audio_bytes = _read_presized(essence_data)
+            if audio_bytes is None:
+                audio_bytes = _to_audio_bytes(essence_data.read())
+            if audio_bytes:
+                class_name = type(essence_data).__name__
+                if 'Stream' in class_name or 'Reader' in class_name:
+                    return audio_bytes, f"aaf2 stream ({class_name})"
+                return audio_bytes, "file-like.read()"
+        except Exception as e:
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error reading essence data (file-like): {e}")
+    return None, None
+
+
+def _read_iterable(f, mob, essence_data):
+    """Method 3: iterable of byte values."""
+    if hasattr(essence_data, '__iter__') and not isinstance(essence_data, (str, bytes)):
+        try:
+            audio_bytes = bytes(essence_data)
+            if audio_bytes:
+                return audio_bytes, "bytes(iterable)"
+        except Exception as e:
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error converting essence data to bytes: {e}")
+    return None, None
+
+
+def _read_data_attr(f, mob, essence_data):
+    """Method 4: bytes (or an iterable of them) in a .data property."""
+    try:
+        data = _attr(essence_data, 'data')
+        audio_bytes = _to_audio_bytes(data)
+        if audio_bytes:
+            return audio_bytes, "essence_data.data (bytes)" if audio_bytes is data else "essence_data.data (converted)"
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing essence_data.data: {e}")
+    return None, None
+
+
+def _read_getvalue(f, mob, essence_data):
+    """Method 5: getvalue() (for BytesIO-like objects)."""
+    if hasattr(essence_data, 'getvalue'):
+        try:
+            val = essence_data.getvalue()
+            audio_bytes = _to_audio_bytes(val)
+            if audio_bytes:
+                return audio_bytes, "getvalue() (bytes)" if audio_bytes is val else "getvalue() (converted)"
+        except Exception as e:
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error with getvalue(): {e}")
+    return None, None
+
+
+def _read_buffer(f, mob, essence_data):
+    """Method 6: readable .buffer attribute."""
+    try:
+        buf = _attr(essence_data, 'buffer')
+        if hasattr(buf, 'read'):
+            audio_bytes = buf.read()
+            if audio_bytes:
+                return audio_bytes, "buffer.read()"
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error accessing buffer: {e}")
+    return None, None
+
+
+def _read_memoryview(f, mob, essence_data):
+    """Method 7: objects supporting the buffer protocol, returned as a view over their memory."""
+    try:
+        view = memoryview(essence_data)
+    except TypeError:
+        # No buffer protocol (this includes ints, which bytes() would have turned into zeros)
+        return None, None
+    try:
+        audio_bytes = _to_audio_bytes(view)
+        if audio_bytes:
+            return audio_bytes, "memoryview(buffer)"
+    except Exception as e:
+        if DEBUG_VERBOSE:
+            _debug_print(f"DEBUG: Error copying essence buffer: {e}")
+    return None, None
+
+
+def _read_open_essence(f, mob, essence_data):
+    """Method 9: reopen the MOB's essence through aaf2's essence reader."""
+    if hasattr(f, 'open_essence'):
+        try:
+            # Try to open essence as a stream
+            essence_stream = f.open_essence(mob)
+            if essence_stream:
+                if hasattr(essence_stream, 'read'):
+                    # Freshly opened, so already at the start
+                    audio_bytes = essence_stream.read()
+                    if audio_bytes:
+                        return audio_bytes, "aaf2.open_essence().read()"
+                elif isinstance(essence_stream, bytes):
+                    return essence_stream, "aaf2.open_essence() (bytes)"
+        except Exception as e:
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error with aaf2.open_essence: {e}")
+    return None, None
+
+
+# Zero-argument accessors that may return an essence's bytes, in the order they're tried
+# (getvalue() is left out; _read_getvalue already tries it as its own reader)
+_ESSENCE_DATA_METHOD_NAMES = ('get_data', 'getbytes', 'tobytes', 'readall', 'read_bytes')
+
+
+@lru_cache(maxsize=64)
+def _essence_data_methods(cls) -> Tuple[str, ...]:
+    """The _ESSENCE_DATA_METHOD_NAMES that cls defines as methods, resolved once per class."""
+    return tuple(name for name in _ESSENCE_DATA_METHOD_NAMES if callable(getattr(cls, name, None)))
+
+
+def _read_data_methods(f, mob, essence_data):
+    """Method 10: common zero-argument data accessor methods."""
+    class_name = essence_data.__class__.__name__
+    for method_name in _essence_data_methods(type(essence_data)):
+        try:
+            result = getattr(essence_data, method_name)()
+            audio_bytes = _to_audio_bytes(result)
+            if audio_bytes:
+                if audio_bytes is result:
+                    return result, f"{class_name}.{method_name}()"
+                return audio_bytes, f"{class_name}.{method_name}() (converted)"
+        except Exception as e:
+            # Callable isn't the same as callable without arguments; move on to the next accessor
+            if DEBUG_VERBOSE:
+                _debug_print(f"DEBUG: Error with {method_name}(): {e}")
+            continue
+    return None, None
+
+
+# Essence readers in the order extract_embedded_audio tries them
+_ESSENCE_READERS = (
+    _read_file_like,
+    _read_iterable,
+    _read_data_attr,
+    _read_getvalue,
+    _read_buffer,
+    _read_memoryview,
+    _read_open_essence,
+    _read_data_methods,
+)
+
+# Types whose bytes can be taken without probing (Method 2 and the buffer-protocol builtins)
+_DIRECT_READERS = {
+    bytes: lambda data: (data, "direct bytes"),
+    bytearray: lambda data: (data, "direct bytearray"),
+    memoryview: lambda data: (_to_audio_bytes(data), "direct memoryview"),
+}
+
+# Readers to try first for essence classes not seen yet, matched in order against the class
+# name (aaf2's stream and reader classes are file-like)
+_READERS_BY_CLASS_NAME = (
+    ('Stream', _read_file_like),
+    ('Reader', _read_file_like),
+)
+
+# The reader that last produced bytes for each essence data type, oldest entries dropped first
+_essence_reader_cache: Dict[type, object] = {}
+_ESSENCE_READER_CACHE_SIZE = 128
+
+
+def _reader_for_class_name(class_name: str):
+    """The reader _READERS_BY_CLASS_NAME picks for a class name, or None."""
+    for fragment, reader in _READERS_BY_CLASS_NAME:
+        if fragment in class_name:
+            return reader
+    return None
+
+
+def _read_essence_bytes(f, mob, essence_data):
+    """
+    Reads the audio bytes out of whatever object the essence probes returned, as
+    (audio_bytes, read method description) or (None, None).
+    
+    The reader that works is fixed per essence data type, so it is looked up by type (or,
+    for a new type, guessed from its class name) and the full chain only runs when that
+    comes up empty.
+    """
+    data_type = type(essence_data)
+    direct = _DIRECT_READERS.get(data_type)
+    if direct is not None:
+        return direct(essence_data)
+    
+    cached_reader = _essence_reader_cache.get(data_type)
+    if cached_reader is None:
+        cached_reader = _reader_for_class_name(data_type.__name__)
+    if cached_reader is not None:
+        audio_bytes, read_method = cached_reader(f, mob, essence_data)
+        if audio_bytes:
+            return audio_bytes, read_method
+    
+    for reader in _ESSENCE_READERS:
+        if reader is cached_reader:
+            continue
+        audio_bytes, read_method = reader(f, mob, essence_data)
+        if audio_bytes:
+            if len(_essence_reader_cache) >= _ESSENCE_READER_CACHE_SIZE:
+                del _essence_reader_cache[next(iter(_essence_reader_cache))]
+            _essence_reader_cache[data_type] = reader
+            return audio_bytes, read_method
+    return None, None
+
+
+# Read size for streaming essence into a WAV file
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Canonical 44-byte PCM WAV header: RIFF chunk, 16-byte fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# The header's two size fields (RIFF chunk size, data chunk size), patched after streaming
+_WAV_SIZE_FIELD = struct.Struct('<I')
+_WAV_RIFF_SIZE_OFFSET = 4
+_WAV_DATA_SIZE_OFFSET = 40
+
+
+def _wav_header(channels: int, sample_width: int, sample_rate: int, data_size: int) -> bytes:
+    """Packs a PCM WAV header (same layout the wave module writes) for data_size audio bytes."""
+    block_align = channels * sample_width
+    return _WAV_HEADER.pack(b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, channels, sample_rate,
+                            sample_rate * block_align, block_align, sample_width * 8, b'data', data_size)
+
+
+def _write_wav_file(output_path: str, channels: int, sample_width: int, sample_rate: int, audio_bytes) -> None:
+    """
+    Writes in-memory PCM as a WAV file.
+    
+    The file is sized up front and the header and payload are copied into a memory map of it,
+    so the payload reaches the page cache in one copy with no intermediate buffer.
+    """
+    header = _wav_header(channels, sample_width, sample_rate, len(audio_bytes))
+    size = len(header) + len(audio_bytes)
+    with open(output_path, 'w+b') as out:
+        out.truncate(size)
+        with mmap.mmap(out.fileno(), size) as mapped:
+            mapped[:len(header)] = header
+            mapped[len(header):] = audio_bytes
+
+
+# Signed 8-bit (AIFC) to unsigned 8-bit (WAV) sample translation table
+_SIGNED_TO_UNSIGNED_8BIT = bytes((b + 128) & 0xFF for b in range(256))
+
+
+def _big_endian_pcm_to_wav(audio_bytes, sample_width: int) -> bytes:
+    """
+    Converts big-endian PCM to the little-endian layout WAV expects, keeping the bit depth.
+    
+    Each byte lane is moved with one extended-slice assignment, so the swap runs in C rather
+    than per sample. A trailing partial sample is dropped.
+    """
+    if sample_width == 1:
+        return bytes(audio_bytes).translate(_SIGNED_TO_UNSIGNED_8BIT)
+    usable = len(audio_bytes) - len(audio_bytes) % sample_width
+    src = bytes(audio_bytes[:usable])
+    out = bytearray(usable)
+    for lane in range(sample_width):
+        out[lane::sample_width] = src[sample_width - 1 - lane::sample_width]
+    return bytes(out)
+
+
+def _remove_partial_output(output_path: str):
+    """Deletes an output file that was created but never completed, if it exists."""
+    try:
+        os.remove(output_path)
+    except OSError:
+        pass
+
+
+def _stream_essence_to_wav(essence_stream, output_path: str, channels: int, sample_width: int, sample_rate: int,
+                           start_time: float, duration: float) -> int:
+    """
+    Copies PCM from a file-like essence stream into a WAV file in fixed-size chunks, so the
+    payload is never held in memory as a whole.
+    
+    start_time/duration are applied as byte offsets the same way extract_embedded_audio trims
+    in-memory audio: seekable streams seek to the start, others have the lead-in read and
+    discarded. Streams with readinto() are read into one reused buffer and written from
+    memoryview slices of it. Returns the number of audio bytes written (0 if the stream had none).
+    
+    No file is left at output_path when nothing was written or the copy raised.
+    """
+    block_align = sample_width * channels
+    bytes_per_second = block_align * sample_rate
+    start_byte = int(start_time * bytes_per_second) if start_time > 0.0 else 0
+    remaining = int((start_time + duration) * bytes_per_second) - start_byte if duration > 0.0 else None
+    # Whole frames per chunk
+    chunk_size = _STREAM_CHUNK_SIZE - _STREAM_CHUNK_SIZE % block_align if block_align else _STREAM_CHUNK_SIZE
+    
+    # io streams always have seek() and raise from it when they can't, so ask seekable() first
+    seekable = getattr(essence_stream, 'seekable', None)
+    if seekable() if seekable is not None else hasattr(essence_stream, 'seek'):
+        essence_stream.seek(start_byte)
+    else:
+        skip = start_byte
+        while skip > 0:
+            discarded = essence_stream.read(min(chunk_size, skip))
+            if not discarded:
+                return 0
+            skip -= len(discarded)
+    
+    readinto = getattr(essence_stream, 'readinto', None)
+    view = memoryview(bytearray(chunk_size)) if readinto is not None else None
+    try:
+        with open(output_path, 'wb', buffering=_STREAM_CHUNK_SIZE) as out:
+            # Placeholder header; the sizes are patched once the data length is known
+            out.write(_wav_header(channels, sample_width, sample_rate, 0))
+            while remaining is None or remaining > 0:
+                wanted = chunk_size if remaining is None else min(chunk_size, remaining)
+                if view is not None:
+                    count = readinto(view[:wanted]) or 0
+                    chunk = view[:count]
+                else:
+                    chunk = essence_stream.read(wanted)
+                    count = len(chunk) if chunk else 0
+                if not count:
+                    break
+                out.write(chunk)
+                if remaining is not None:
+                    remaining -= count
+            written = out.tell() - _WAV_HEADER.size
+            if written:
+                out.seek(_WAV_RIFF_SIZE_OFFSET)
+                out.write(_WAV_SIZE_FIELD.pack(36 + written))
+                out.seek(_WAV_DATA_SIZE_OFFSET)
+                out.write(_WAV_SIZE_FIELD.pack(written))
+    except Exception:
+        _remove_partial_output(output_path)
+        raise
+    if not written:
+        _remove_partial_output(output_path)
+    return written
+
+
+def extract_embedded_audio(aaf_file_path: str, mob_id: str, output_path: str, start_time: float = 0.0, duration: float = 0.0) -> bool:
     """
     Extracts embedded audio from an AAF file for a specific MOB.
     
@@ -3291,46 +3475,17 @@ def format_report(report: ValidationReport) -> str:
         return False
     
     try:
-        import tempfile
-        import wave
-        import sys
-        
         with aaf2.open(aaf_file_path, 'r') as f:
             # Find the MOB by ID - try multiple ID formats
-            mob = None
-            mobs_list = list(f.content.mobs.values()) if hasattr(f.content.mobs, 'values') else list(f.content.mobs)
-            
-            for m in mobs_list:
-                try:
-                    # Try different ways to get the MOB ID
-                    m_id = None
-                    if hasattr(m, 'mob_id'):
-                        m_id = str(m.mob_id)
-                    elif hasattr(m, 'mob_id') and m.mob_id:
-                        m_id = str(m.mob_id)
-                    else:
-                        # Fallback: try to get ID from properties
-                        try:
-                            props = m.properties if hasattr(m, 'properties') else {}
-                            if 'MobID' in props:
-                                m_id = str(props['MobID'])
-                        except Exception:
-                            pass
-                    
-                    if m_id and m_id == mob_id:
-                        mob = m
-                        break
-                except Exception as e:
-                    continue
+            mob = _find_mob_by_id(f.content.mobs, mob_id)
             
             if not mob:
                 print(f"Error: MOB with ID '{mob_id}' not found in AAF file", file=sys.stderr)
                 return False
             
             # Find the Essence MOB if this is a Composition MOB
-            essence_mob = _find_essence_mob_from_composition_mob(mob)
-            if essence_mob:
-                mob = essence_mob
+            cache_key = _extraction_cache_key(aaf_file_path, mob_id)
+            mob = _resolve_extraction_mob(f, cache_key, mob)
             
             # Check if MOB has embedded essence
             if not hasattr(mob, 'descriptor'):
@@ -3344,8 +3499,8 @@ def format_report(report: ValidationReport) -> str:
             
             # Check for external locator (not embedded)
             # Handle locator as a list (common in AAF files)
-            if hasattr(descriptor, 'locator') and descriptor.locator:
-                locator_value = descriptor.locator
+            locator_value = _attr(descriptor, 'locator')
+            if locator_value:
                 locators_to_check = []
                 if isinstance(locator_value, (list, tuple)):
                     locators_to_check = list(locator_value)
@@ -3359,15 +3514,16 @@ def format_report(report: ValidationReport) -> str:
                         continue
                     
                     # Check for path
-                    if hasattr(locator, 'path') and locator.path:
+                    if _attr(locator, 'path'):
                         has_external_locator = True
                         break
                     
                     # Check for URL
-                    if hasattr(locator, 'url_string') and locator.url_string:
-                        url = str(locator.url_string)
+                    url_string = _attr(locator, 'url_string')
+                    if url_string:
+                        url = str(url_string)
                         # Only external if it's file:// or http:// URL
-                        if url.startswith('file://') or url.startswith('http://') or url.startswith('https://'):
+                        if url.startswith(_EXTERNAL_URL_PREFIXES):
                             has_external_locator = True
                             break
                         # If it's a non-urn URL, might still be external
@@ -3381,508 +3537,101 @@ def format_report(report: ValidationReport) -> str:
             
             # Extract essence data - try multiple methods comprehensively
             # In AAF files, embedded essence can be stored in various ways
-            essence_data = None
-            essence_source = None
-            
-            # Method 1: Try descriptor.essence
-            if hasattr(descriptor, 'essence'):
-                try:
-                    essence_data = getattr(descriptor, 'essence', None)
-                    if essence_data is not None:
-                        essence_source = "descriptor.essence"
-                except Exception as e:
-                    print(f"DEBUG: Error accessing descriptor.essence: {e}", file=sys.stderr)
-            
-            # Method 2: Try descriptor.essence_data
-            if not essence_data and hasattr(descriptor, 'essence_data'):
-                try:
-                    essence_data = getattr(descriptor, 'essence_data', None)
-                    if essence_data is not None:
-                        essence_source = "descriptor.essence_data"
-                except Exception as e:
-                    print(f"DEBUG: Error accessing descriptor.essence_data: {e}", file=sys.stderr)
-            
-            # Method 3: Try descriptor.essence_access
-            if not essence_data and hasattr(descriptor, 'essence_access'):
-                try:
-                    essence_data = getattr(descriptor, 'essence_access', None)
-                    if essence_data is not None:
-                        essence_source = "descriptor.essence_access"
-                except Exception as e:
-                    print(f"DEBUG: Error accessing descriptor.essence_access: {e}", file=sys.stderr)
-            
-            # Method 4: Try MOB.essence directly
-            if not essence_data and hasattr(mob, 'essence'):
-                try:
-                    essence_data = getattr(mob, 'essence', None)
-                    if essence_data is not None:
-                        essence_source = "mob.essence"
-                except Exception as e:
-                    print(f"DEBUG: Error accessing mob.essence: {e}", file=sys.stderr)
-            
-            # Method 5: Try accessing through MOB slots (essence might be in slot segments)
-            if not essence_data and hasattr(mob, 'slots'):
-                try:
-                    slot_list = list(mob.slots) if hasattr(mob.slots, '__iter__') else []
-                    for slot in slot_list:
-                        if hasattr(slot, 'segment') and slot.segment:
-                            seg = slot.segment
-                            # Check if segment has essence
-                            if hasattr(seg, 'mob') and seg.mob:
-                                seg_mob = seg.mob
-                                if hasattr(seg_mob, 'descriptor'):
-                                    seg_desc = seg_mob.descriptor
-                                    if hasattr(seg_desc, 'essence'):
-                                        try:
-                                            essence_data = getattr(seg_desc, 'essence', None)
-                                            if essence_data is not None:
-                                                essence_source = "slot.segment.mob.descriptor.essence"
-                                                break
-                                        except Exception:
-                                            pass
-                                    if not essence_data and hasattr(seg_desc, 'essence_data'):
-                                        try:
-                                            essence_data = getattr(seg_desc, 'essence_data', None)
-                                            if essence_data is not None:
-                                                essence_source = "slot.segment.mob.descriptor.essence_data"
-                                                break
-                                        except Exception:
-                                            pass
-                            
-                            # Also try to read essence data directly from slot if it has a reader
-                            if not essence_data and hasattr(slot, 'read'):
-                                try:
-                                    slot_data = slot.read()
-                                    if slot_data:
-                                        essence_data = slot_data
-                                        essence_source = "slot.read()"
-                                        break
-                                except Exception:
-                                    pass
-                            
-                            # Try accessing essence through slot's segment directly
-                            if not essence_data and hasattr(seg, 'essence'):
-                                try:
-                                    essence_data = getattr(seg, 'essence', None)
-                                    if essence_data is not None:
-                                        essence_source = "slot.segment.essence"
-                                        break
-                                except Exception:
-                                    pass
-                except Exception as e:
-                    print(f"DEBUG: Error accessing MOB slots: {e}", file=sys.stderr)
-            
-            # Method 6: Try using aaf2's stream/reader API if available
-            if not essence_data:
-                try:
-                    # Some AAF files store essence in a stream that needs to be opened
-                    if hasattr(f, 'open_essence'):
-                        try:
-                            essence_stream = f.open_essence(mob)
-                            if essence_stream:
-                                essence_data = essence_stream
-                                essence_source = "aaf2.open_essence"
-                        except Exception as e:
-                            print(f"DEBUG: Error with aaf2.open_essence: {e}", file=sys.stderr)
-                    
-                    # Try reading essence using file's read method if available
-                    if not essence_data and hasattr(f, 'read'):
-                        try:
-                            # Some aaf2 files allow reading essence directly
-                            if hasattr(f, 'read_essence'):
-                                essence_data = f.read_essence(mob)
-                                if essence_data:
-                                    essence_source = "aaf2.read_essence(mob)"
-                        except Exception as e:
-                            print(f"DEBUG: Error with aaf2.read_essence: {e}", file=sys.stderr)
-                except Exception as e:
-                    print(f"DEBUG: Error trying aaf2 stream API: {e}", file=sys.stderr)
-            
-            # Method 7: Try accessing through descriptor properties/keys
-            if not essence_data:
-                try:
-                    # Some descriptors store essence in properties
-                    if hasattr(descriptor, 'properties'):
-                        props = descriptor.properties
-                        # Handle case where properties is a method that needs to be called
-                        if callable(props):
-                            try:
-                                props = props()
-                            except Exception as e:
-                                print(f"DEBUG: Error calling descriptor.properties(): {e}", file=sys.stderr)
-                                props = None
-                        
-                        # Now check if props is a dict-like object
-                        if props is not None:
-                            # Try to access as dict
-                            if isinstance(props, dict):
-                                for key in ['EssenceData', 'Essence', 'Data', 'AudioData']:
-                                    if key in props:
-                                        try:
-                                            essence_data = props[key]
-                                            if essence_data is not None:
-                                                essence_source = f"descriptor.properties[{key}]"
-                                                break
-                                        except Exception:
-                                            pass
-                            # Try to access via getattr if it's an object with attributes
-                            elif hasattr(props, '__getitem__'):
-                                for key in ['EssenceData', 'Essence', 'Data', 'AudioData']:
-                                    try:
-                                        if key in props:
-                                            essence_data = props[key]
-                                            if essence_data is not None:
-                                                essence_source = f"descriptor.properties[{key}]"
-                                                break
-                                    except (KeyError, TypeError, AttributeError):
-                                        pass
-                except Exception as e:
-                    print(f"DEBUG: Error accessing descriptor properties: {e}", file=sys.stderr)
-            
-            # Method 8: Try accessing through file's essence container
-            if not essence_data:
-                try:
-                    # AAF files may store essence in a separate container
-                    if hasattr(f, 'essence') and f.essence:
-                        try:
-                            # Try to get essence by MOB ID
-                            essence_container = f.essence
-                            if hasattr(essence_container, 'get'):
-                                essence_data = essence_container.get(mob_id, None)
-                                if essence_data:
-                                    essence_source = "file.essence.get(mob_id)"
-                        except Exception as e:
-                            print(f"DEBUG: Error accessing file.essence: {e}", file=sys.stderr)
-                    
-                    # Also try essence_data attribute
-                    if not essence_data and hasattr(f, 'essence_data'):
-                        try:
-                            essence_data = f.essence_data
-                            if essence_data:
-                                essence_source = "file.essence_data"
-                        except Exception as e:
-                            print(f"DEBUG: Error accessing file.essence_data: {e}", file=sys.stderr)
-                except Exception as e:
-                    print(f"DEBUG: Error accessing file essence container: {e}", file=sys.stderr)
-            
-            # Method 9: If essence attribute exists but value is None, try to access through file stream
-            # This handles cases where essence is stored but needs to be read through the file
-            if not essence_data and (hasattr(descriptor, 'essence') or hasattr(mob, 'essence')):
-                try:
-                    # Try to use the file's stream to read essence data
-                    # Some AAF files store essence data that needs to be read through the file stream
-                    if hasattr(f, 'stream') and f.stream:
-                        try:
-                            # Try to get stream for this MOB
-                            stream = f.stream
-                            if hasattr(stream, 'read_essence'):
-                                essence_data = stream.read_essence(mob)
-                                if essence_data:
-                                    essence_source = "file.stream.read_essence(mob)"
-                        except Exception as e:
-                            print(f"DEBUG: Error with file.stream.read_essence: {e}", file=sys.stderr)
-                    
-                    # Also try reading essence directly from file using MOB ID
-                    if not essence_data and mob_id:
-                        try:
-                            # Try to find essence data in file by MOB ID
-                            # Some AAF files store essence indexed by MOB ID
-                            if hasattr(f, 'content') and f.content:
-                                # Try to find essence MOB in file content
-                                try:
-                                    # Look for essence MOBs in the file
-                                    if hasattr(f.content, 'mobs'):
-                                        mobs = f.content.mobs
-                                        if hasattr(mobs, '__iter__'):
-                                            for file_mob in mobs:
-                                                try:
-                                                    if hasattr(file_mob, 'mob_id'):
-                                                        file_mob_id = str(file_mob.mob_id)
-                                                        if file_mob_id == mob_id:
-                                                            # Found the MOB, try to get essence
-                                                            if hasattr(file_mob, 'essence'):
-                                                                essence_val = getattr(file_mob, 'essence', None)
-                                                                if essence_val is not None:
-                                                                    essence_data = essence_val
-                                                                    essence_source = "file.content.mobs[mob_id].essence"
-                                                                    break
-                                                except Exception:
-                                                    continue
-                                except Exception as e:
-                                    print(f"DEBUG: Error searching file.content.mobs: {e}", file=sys.stderr)
-                        except Exception as e:
-                            print(f"DEBUG: Error accessing file content by MOB ID: {e}", file=sys.stderr)
-                    
-                    # Method 10: Try to read essence data from file's essence storage directly
-                    # When mob.essence is None, the data might be in the file's essence container
-                    if not essence_data:
-                        try:
-                            # Try to access file's essence storage
-                            if hasattr(f, 'essence') or hasattr(f.content, 'essence'):
-                                essence_storage = getattr(f, 'essence', None) or getattr(f.content, 'essence', None)
-                                if essence_storage:
-                                    # Try to get essence by MOB
-                                    if hasattr(essence_storage, 'get'):
-                                        try:
-                                            essence_data = essence_storage.get(mob, None)
-                                            if essence_data:
-                                                essence_source = "file.essence.get(mob)"
-                                        except Exception:
-                                            pass
-                                    
-                                    # Try iterating through essence storage
-                                    if not essence_data and hasattr(essence_storage, '__iter__'):
-                                        try:
-                                            for essence_item in essence_storage:
-                                                # Try to match by MOB or MOB ID
-                                                if hasattr(essence_item, 'mob') and essence_item.mob == mob:
-                                                    if hasattr(essence_item, 'data'):
-                                                        essence_data = essence_item.data
-                                                        essence_source = "file.essence[item].data"
-                                                        break
-                                                elif hasattr(essence_item, 'mob_id'):
-                                                    item_mob_id = str(essence_item.mob_id)
-                                                    if item_mob_id == mob_id:
-                                                        if hasattr(essence_item, 'data'):
-                                                            essence_data = essence_item.data
-                                                            essence_source = "file.essence[item].data (by ID)"
-                                                            break
-                                        except Exception as e:
-                                            print(f"DEBUG: Error iterating essence storage: {e}", file=sys.stderr)
-                        except Exception as e:
-                            print(f"DEBUG: Error accessing file essence storage: {e}", file=sys.stderr)
-                except Exception as e:
-                    print(f"DEBUG: Error accessing file stream: {e}", file=sys.stderr)
+            essence_data, essence_source = _find_essence_data(f, mob, descriptor, mob_id)
             
             # Log what we found
             if essence_data:
-                print(f"DEBUG: Found essence data via {essence_source}, type: {type(essence_data).__name__}", file=sys.stderr)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Found essence data via {essence_source}, type: {type(essence_data).__name__}")
             else:
                 # Final attempt: Check if we can at least verify the structure
                 # If MOB has essence attribute but value is None, it might still be accessible
                 # through a different mechanism - log detailed info for debugging
-                print(f"DEBUG: No essence data found. MOB structure:", file=sys.stderr)
-                print(f"DEBUG:   - hasattr(mob, 'essence'): {hasattr(mob, 'essence')}", file=sys.stderr)
-                print(f"DEBUG:   - hasattr(descriptor, 'essence'): {hasattr(descriptor, 'essence')}", file=sys.stderr)
-                print(f"DEBUG:   - hasattr(descriptor, 'essence_data'): {hasattr(descriptor, 'essence_data')}", file=sys.stderr)
-                if hasattr(descriptor, 'essence'):
-                    try:
-                        val = getattr(descriptor, 'essence', None)
-                        print(f"DEBUG:   - descriptor.essence value: {val} (type: {type(val).__name__})", file=sys.stderr)
-                    except Exception as e:
-                        print(f"DEBUG:   - Error getting descriptor.essence: {e}", file=sys.stderr)
-                if hasattr(mob, 'essence'):
-                    try:
-                        val = getattr(mob, 'essence', None)
-                        print(f"DEBUG:   - mob.essence value: {val} (type: {type(val).__name__})", file=sys.stderr)
-                    except Exception as e:
-                        print(f"DEBUG:   - Error getting mob.essence: {e}", file=sys.stderr)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: No essence data found. MOB structure:")
+                    _debug_print(f"DEBUG:   - hasattr(mob, 'essence'): {hasattr(mob, 'essence')}")
+                    _debug_print(f"DEBUG:   - hasattr(descriptor, 'essence'): {hasattr(descriptor, 'essence')}")
+                    _debug_print(f"DEBUG:   - hasattr(descriptor, 'essence_data'): {hasattr(descriptor, 'essence_data')}")
+                    if hasattr(descriptor, 'essence'):
+                        try:
+                            val = getattr(descriptor, 'essence', None)
+                            _debug_print(f"DEBUG:   - descriptor.essence value: {val} (type: {type(val).__name__})")
+                        except Exception as e:
+                            _debug_print(f"DEBUG:   - Error getting descriptor.essence: {e}")
+                    if hasattr(mob, 'essence'):
+                        try:
+                            val = getattr(mob, 'essence', None)
+                            _debug_print(f"DEBUG:   - mob.essence value: {val} (type: {type(val).__name__})")
+                        except Exception as e:
+                            _debug_print(f"DEBUG:   - Error getting mob.essence: {e}")
                 print(f"Error: No essence data found in MOB descriptor or MOB (tried all methods)", file=sys.stderr)
                 return False
             
             # Get audio properties from descriptor
-            sample_rate = 48000  # Default
-            channels = 2  # Default
-            sample_width = 2  # 16-bit default
+            sample_rate, channels, sample_width = _audio_properties(descriptor, cache_key)
             
-            try:
-                # Try to get sample rate
-                if hasattr(descriptor, 'sample_rate') and descriptor.sample_rate:
-                    sample_rate = int(descriptor.sample_rate)
-                elif hasattr(descriptor, 'AudioSamplingRate') and descriptor.AudioSamplingRate:
-                    sample_rate = int(descriptor.AudioSamplingRate)
-                
-                # Try to get channels
-                if hasattr(descriptor, 'channels') and descriptor.channels:
-                    channels = int(descriptor.channels)
-                elif hasattr(descriptor, 'AudioChannelCount') and descriptor.AudioChannelCount:
-                    channels = int(descriptor.AudioChannelCount)
-                
-                # Try to get bit depth
-                if hasattr(descriptor, 'bits_per_sample') and descriptor.bits_per_sample:
-                    sample_width = int(descriptor.bits_per_sample) // 8
-                elif hasattr(descriptor, 'AudioBitsPerSample') and descriptor.AudioBitsPerSample:
-                    sample_width = int(descriptor.AudioBitsPerSample) // 8
-            except Exception as e:
-                print(f"Warning: Could not read all audio properties, using defaults: {e}", file=sys.stderr)
+            # AIFC essence is big-endian (signed 8-bit) PCM; WAV data is little-endian (unsigned 8-bit)
+            need_convert = type(descriptor).__name__ == 'AIFCDescriptor'
+            
+            # File-like essence is copied into the WAV in chunks instead of being read into memory
+            if not need_convert and hasattr(essence_data, 'read'):
+                try:
+                    streamed = _stream_essence_to_wav(essence_data, output_path, channels, sample_width, sample_rate,
+                                                      start_time, duration)
+                except Exception as e:
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Error streaming essence data: {e}")
+                    streamed = 0
+                if streamed:
+                    if DEBUG_VERBOSE:
+                        _debug_print(f"DEBUG: Successfully streamed {streamed} bytes via file-like.read()")
+                    return True
             
             # Read essence data - try multiple methods comprehensively
             audio_bytes = None
             read_method = None
             
             try:
-                # Method 1: File-like object with read() method
-                if hasattr(essence_data, 'read'):
-                    try:
-                        if hasattr(essence_data, 'seek'):
-                            essence_data.seek(0)
-                        audio_bytes = essence_data.read()
-                        if audio_bytes:
-                            read_method = "file-like.read()"
-                    except Exception as e:
-                        print(f"DEBUG: Error reading essence data (file-like): {e}", file=sys.stderr)
-                
-                # Method 2: Already bytes
-                if not audio_bytes and isinstance(essence_data, bytes):
-                    audio_bytes = essence_data
-                    read_method = "direct bytes"
-                
-                # Method 3: Try to convert iterable to bytes
-                if not audio_bytes and hasattr(essence_data, '__iter__') and not isinstance(essence_data, (str, bytes)):
-                    try:
-                        audio_bytes = bytes(essence_data)
-                        if audio_bytes:
-                            read_method = "bytes(iterable)"
-                    except Exception as e:
-                        print(f"DEBUG: Error converting essence data to bytes: {e}", file=sys.stderr)
-                
-                # Method 4: Try accessing .data property
-                if not audio_bytes and hasattr(essence_data, 'data'):
-                    try:
-                        data = essence_data.data
-                        if isinstance(data, bytes):
-                            audio_bytes = data
-                            read_method = "essence_data.data (bytes)"
-                        elif hasattr(data, '__iter__') and not isinstance(data, str):
-                            audio_bytes = bytes(data)
-                            if audio_bytes:
-                                read_method = "essence_data.data (converted)"
-                    except Exception as e:
-                        print(f"DEBUG: Error accessing essence_data.data: {e}", file=sys.stderr)
-                
-                # Method 5: Try accessing through getvalue() (for StringIO-like objects)
-                if not audio_bytes and hasattr(essence_data, 'getvalue'):
-                    try:
-                        val = essence_data.getvalue()
-                        if isinstance(val, bytes):
-                            audio_bytes = val
-                            read_method = "getvalue() (bytes)"
-                        elif hasattr(val, '__iter__') and not isinstance(val, str):
-                            audio_bytes = bytes(val)
-                            if audio_bytes:
-                                read_method = "getvalue() (converted)"
-                    except Exception as e:
-                        print(f"DEBUG: Error with getvalue(): {e}", file=sys.stderr)
-                
-                # Method 6: Try accessing through buffer or memoryview
-                if not audio_bytes:
-                    try:
-                        if hasattr(essence_data, 'buffer'):
-                            buf = essence_data.buffer
-                            if hasattr(buf, 'read'):
-                                audio_bytes = buf.read()
-                                if audio_bytes:
-                                    read_method = "buffer.read()"
-                    except Exception as e:
-                        print(f"DEBUG: Error accessing buffer: {e}", file=sys.stderr)
-                
-                # Method 7: Try using memoryview if it's a buffer-like object
-                if not audio_bytes:
-                    try:
-                        mv = memoryview(essence_data)
-                        audio_bytes = mv.tobytes()
-                        if audio_bytes:
-                            read_method = "memoryview.tobytes()"
-                    except (TypeError, AttributeError):
-                        pass
-                    except Exception as e:
-                        print(f"DEBUG: Error with memoryview: {e}", file=sys.stderr)
-                
-                # Method 8: Try accessing through aaf2's stream API if it's a stream
-                if not audio_bytes and hasattr(essence_data, '__class__'):
-                    class_name = essence_data.__class__.__name__
-                    # Check if it's an aaf2 stream type
-                    if 'Stream' in class_name or 'Reader' in class_name:
-                        try:
-                            if hasattr(essence_data, 'read'):
-                                essence_data.seek(0) if hasattr(essence_data, 'seek') else None
-                                audio_bytes = essence_data.read()
-                                if audio_bytes:
-                                    read_method = f"aaf2 stream ({class_name})"
-                        except Exception as e:
-                            print(f"DEBUG: Error reading from aaf2 stream: {e}", file=sys.stderr)
-                
-                # Method 9: Try accessing through aaf2 essence reader if available
-                if not audio_bytes and hasattr(f, 'open_essence'):
-                    try:
-                        # Try to open essence as a stream
-                        essence_stream = f.open_essence(mob)
-                        if essence_stream:
-                            if hasattr(essence_stream, 'read'):
-                                essence_stream.seek(0) if hasattr(essence_stream, 'seek') else None
-                                audio_bytes = essence_stream.read()
-                                if audio_bytes:
-                                    read_method = "aaf2.open_essence().read()"
-                            elif isinstance(essence_stream, bytes):
-                                audio_bytes = essence_stream
-                                read_method = "aaf2.open_essence() (bytes)"
-                    except Exception as e:
-                        print(f"DEBUG: Error with aaf2.open_essence: {e}", file=sys.stderr)
-                
-                # Method 10: If essence_data is an object with special methods, try them
-                if not audio_bytes and hasattr(essence_data, '__class__'):
-                    class_name = essence_data.__class__.__name__
-                    # Try common data access methods
-                    for method_name in ['get_data', 'getbytes', 'tobytes', 'getvalue', 'readall', 'read_bytes']:
-                        if hasattr(essence_data, method_name):
-                            try:
-                                method = getattr(essence_data, method_name)
-                                if callable(method):
-                                    result = method()
-                                    if isinstance(result, bytes):
-                                        audio_bytes = result
-                                        read_method = f"{class_name}.{method_name}()"
-                                        break
-                                    elif hasattr(result, '__iter__') and not isinstance(result, str):
-                                        audio_bytes = bytes(result)
-                                        if audio_bytes:
-                                            read_method = f"{class_name}.{method_name}() (converted)"
-                                            break
-                            except Exception as e:
-                                print(f"DEBUG: Error with {method_name}(): {e}", file=sys.stderr)
-                                continue
-                
+                audio_bytes, read_method = _read_essence_bytes(f, mob, essence_data)
             except Exception as e:
-                print(f"DEBUG: Error reading essence data: {e}", file=sys.stderr)
-                import traceback
-                print(f"DEBUG: Traceback: {traceback.format_exc()}", file=sys.stderr)
+                if DEBUG_VERBOSE:
+                    _debug_print(f"DEBUG: Error reading essence data: {e}")
+                    _debug_print(f"DEBUG: Traceback: {traceback.format_exc()}")
             
-            if audio_bytes:
-                print(f"DEBUG: Successfully read {len(audio_bytes)} bytes via {read_method}", file=sys.stderr)
-            else:
-                print(f"DEBUG: Failed to read audio bytes. Essence data type: {type(essence_data).__name__}", file=sys.stderr)
-                print(f"DEBUG: Essence data attributes: {[attr for attr in dir(essence_data) if not attr.startswith('_')][:20]}", file=sys.stderr)
+            if DEBUG_VERBOSE:
+                if audio_bytes:
+                    _debug_print(f"DEBUG: Successfully read {len(audio_bytes)} bytes via {read_method}")
+                else:
+                    _debug_print(f"DEBUG: Failed to read audio bytes. Essence data type: {type(essence_data).__name__}")
+                    # The class's own public names; dir() would walk the whole MRO only to keep 20
+                    public_attrs = list(islice((attr for attr in vars(type(essence_data)) if not attr.startswith('_')), 20))
+                    _debug_print(f"DEBUG: Essence data attributes: {public_attrs}")
             
-            if not audio_bytes or len(audio_bytes) == 0:
+            if not audio_bytes:
                 print(f"Error: No audio bytes extracted from essence data (tried all read methods)", file=sys.stderr)
                 return False
             
-            # Apply start time and duration offsets if specified
+            # Apply start time and duration offsets if specified (as a view, so the kept
+            # range isn't copied before it is written)
             if start_time > 0.0 or duration > 0.0:
                 bytes_per_sample = sample_width * channels
                 samples_per_second = sample_rate
                 bytes_per_second = bytes_per_sample * samples_per_second
                 
                 start_byte = int(start_time * bytes_per_second)
-                if duration > 0.0:
-                    end_byte = int((start_time + duration) * bytes_per_second)
-                    if end_byte > len(audio_bytes):
-                        end_byte = len(audio_bytes)
-                    audio_bytes = audio_bytes[start_byte:end_byte]
-                else:
-                    audio_bytes = audio_bytes[start_byte:]
+                end_byte = int((start_time + duration) * bytes_per_second) if duration > 0.0 else len(audio_bytes)
+                # The audio is known to be non-empty, so only the range itself can empty it
+                if start_byte >= min(end_byte, len(audio_bytes)):
+                    print(f"Error: No audio bytes after applying time offsets", file=sys.stderr)
+                    return False
+                audio_bytes = memoryview(audio_bytes)[start_byte:end_byte]
             
-            if not audio_bytes or len(audio_bytes) == 0:
-                print(f"Error: No audio bytes after applying time offsets", file=sys.stderr)
-                return False
+            if need_convert:
+                audio_bytes = _big_endian_pcm_to_wav(audio_bytes, sample_width)
             
             # Write WAV file
             try:
-                with wave.open(output_path, 'wb') as wav_file:
-                    wav_file.setnchannels(channels)
-                    wav_file.setsampwidth(sample_width)
-                    wav_file.setframerate(sample_rate)
-                    wav_file.writeframes(audio_bytes)
+                _write_wav_file(output_path, channels, sample_width, sample_rate, audio_bytes)
             except Exception as e:
                 print(f"Error writing WAV file: {e}", file=sys.stderr)
                 return False
@@ -3891,17 +3640,60 @@ def format_report(report: ValidationReport) -> str:
     
     except Exception as e:
         print(f"Error extracting embedded audio: {e}", file=sys.stderr)
-        import traceback
         print(f"Traceback: {traceback.format_exc()}", file=sys.stderr)
         return False
+
+
+def extract_embedded_audio_batch(aaf_file_path: str, mob_ids_and_outputs: List[Tuple[str, str]],
+                                 max_workers: Optional[int] = None) -> List[bool]:
+    """
+    Extracts several embedded stems from one AAF file in parallel.
+    
+    Each stem is independent, and AAF parsing holds the GIL, so the extractions run in worker
+    processes; every worker opens the file itself since aaf2 handles can't be shared.
+    
+    Args:
+        aaf_file_path: Path to the AAF file
+        mob_ids_and_outputs: (MOB ID, output WAV path) pairs
+        max_workers: Worker process count (defaults to the CPU count)
+        
+    Returns:
+        List[bool]: extract_embedded_audio's result for each pair, in order
+    """
+    if len(mob_ids_and_outputs) <= 1:
+        return [extract_embedded_audio(aaf_file_path, mob_id, output_path)
+                for mob_id, output_path in mob_ids_and_outputs]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(extract_embedded_audio, aaf_file_path, mob_id, output_path)
+                   for mob_id, output_path in mob_ids_and_outputs]
+        return [future.result() for future in futures]
 # ============================================================================
 # END ARCHIVED: extract_embedded_audio
 # ============================================================================
 
 
-if __name__ == "__main__":
-    import sys
+# Write buffer for the JSON report on stdout
+_STDOUT_BUFFER_SIZE = 1 << 20
+
+
+def _write_json_stdout(output: Dict):
+    """
+    Writes output as indented JSON plus a newline to stdout and flushes it.
     
+    The JSON is encoded straight into a 1 MiB binary buffer over stdout's file descriptor, so
+    a large report reaches the app's pipe in a few big writes instead of many small ones.
+    """
+    sys.stdout.flush()
+    with os.fdopen(sys.stdout.fileno(), 'wb', buffering=_STDOUT_BUFFER_SIZE, closefd=False) as binary_out:
+        text_out = io.TextIOWrapper(binary_out, encoding='utf-8')
+        json.dump(output, text_out, indent=2, check_circular=False)
+        text_out.write("\n")
+        text_out.flush()
+        text_out.detach()
+
+
+if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python media_validator.py <path_to_omf_or_aaf_file>", file=sys.stderr)
         sys.exit(1)
@@ -3915,7 +3707,8 @@ if __name__ == "__main__":
     
     # Set global debug verbosity flag
     # Access the module-level variable directly
-    globals()['DEBUG_VERBOSE'] = True  # Always verbose now that playback is disabled
+    # Always verbose now that playback is disabled; MEDIADASH_DEBUG=0 turns the DEBUG: lines off
+    globals()['DEBUG_VERBOSE'] = os.environ.get('MEDIADASH_DEBUG', '1') != '0'
     
     try:
         # ARCHIVED: Extract mode disabled
@@ -3940,10 +3733,6 @@ if __name__ == "__main__":
         # ARCHIVED: Playback mode disabled
         elif False and playback_mode:
             # Create debug log file
-            import tempfile
-            import os
-            from pathlib import Path
-            
             # Create debug log in Downloads folder
             downloads_dir = os.path.expanduser("~/Downloads")
             aaf_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -3953,7 +3742,7 @@ if __name__ == "__main__":
             globals()['_DEBUG_FILE'] = open(debug_log_path, 'w', encoding='utf-8')
             globals()['_DEBUG_FILE'].write(f"=== Playback Clip Extraction Debug Log ===\n")
             globals()['_DEBUG_FILE'].write(f"File: {file_path}\n")
-            globals()['_DEBUG_FILE'].write(f"Timestamp: {__import__('datetime').datetime.now().isoformat()}\n")
+            globals()['_DEBUG_FILE'].write(f"Timestamp: {datetime.datetime.now().isoformat()}\n")
             globals()['_DEBUG_FILE'].write(f"{'=' * 60}\n\n")
             globals()['_DEBUG_FILE'].flush()
             
@@ -3964,7 +3753,7 @@ if __name__ == "__main__":
                 # Extract playback clips and output as JSON
                 clips = extract_playback_clips(file_path)
                 output = {
-                    "clips": [asdict(clip) for clip in clips]
+                    "clips": [_clip_to_dict(clip, _PLAYBACK_CLIP_FIELDS) for clip in clips]
                 }
                 
                 # Write final summary to debug file
@@ -3976,9 +3765,7 @@ if __name__ == "__main__":
                     globals()['_DEBUG_FILE'] = None
                 
                 # Output JSON to stdout and flush immediately
-                json_output = json.dumps(output, indent=2)
-                print(json_output, flush=True)
-                sys.stdout.flush()
+                _write_json_stdout(output)
                 sys.exit(0)
             except Exception as e:
                 # Make sure debug file is closed even on error
@@ -4004,11 +3791,10 @@ if __name__ == "__main__":
                 "valid_clips": report.valid_clips,
                 "file_path": report.file_path,
                 "total_duration": report.total_duration,
-                "missing_clip_details": [asdict(clip) for clip in report.missing_clip_details],
-                "timeline_clips": [asdict(clip) for clip in report.timeline_clips]
+                "missing_clip_details": [_clip_to_dict(clip, _MEDIA_CLIP_FIELDS) for clip in report.missing_clip_details],
+                "timeline_clips": [_clip_to_dict(clip, _MEDIA_CLIP_FIELDS) for clip in report.timeline_clips]
             }
-            json_output = json.dumps(output, indent=2)
-            print(json_output, flush=True)
+            _write_json_stdout(output)
             
             # Exit with error code if there are missing clips
             if report.missing_clips > 0: